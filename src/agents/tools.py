@@ -18,6 +18,8 @@ import httpx
 import yaml
 from dotenv import load_dotenv
 
+from ..utils.keyword_matcher import KeywordMatcher
+
 load_dotenv()
 
 
@@ -163,6 +165,29 @@ def _validate_url(url: str) -> tuple[bool, str]:
         return False, f"URL 解析失敗: {str(e)}"
 
 
+# 各內建法規資料庫的關鍵字比對器快取：{id(laws_db): (laws_db, matcher)}
+_LAW_MATCHERS: dict[int, tuple[dict, KeywordMatcher]] = {}
+
+
+def _get_law_matcher(laws_db: dict[str, dict]) -> KeywordMatcher:
+    """
+    取得法規資料庫的關鍵字比對器（每個資料庫只建構一次）
+
+    關鍵字、法規名稱、中文名稱都對應到該法規名稱。
+    """
+    cached = _LAW_MATCHERS.get(id(laws_db))
+    if cached is not None and cached[0] is laws_db:
+        return cached[1]
+
+    matcher = KeywordMatcher(
+        (keyword, law_name)
+        for law_name, info in laws_db.items()
+        for keyword in (*info.get("keywords", []), law_name, info.get("name_zh", ""))
+    )
+    _LAW_MATCHERS[id(laws_db)] = (laws_db, matcher)
+    return matcher
+
+
 def _match_laws_by_keywords(
     query: str,
     laws_db: dict[str, dict],
@@ -179,32 +204,29 @@ def _match_laws_by_keywords(
     Returns:
         匹配的法規列表
     """
-    matched = []
-    query_lower = query.lower()
+    # 一次掃描查詢字串，找出命中的法規名稱
+    hits = _get_law_matcher(laws_db).match(query)
+    if not hits:
+        return []
 
+    matched = []
     for law_name, info in laws_db.items():
-        keywords = info.get("keywords", [])
-        name_zh = info.get("name_zh", "")
-
-        # 檢查關鍵字匹配
-        keyword_match = any(kw in query_lower or kw in query for kw in keywords)
-        # 檢查法規名稱匹配
-        name_match = law_name.lower() in query_lower or name_zh in query
-
-        if keyword_match or name_match:
-            result = {
-                "title": law_name,
-                "name_zh": name_zh,
-                "url": info.get("url", ""),
-                "jurisdiction": jurisdiction,
-                "type": info.get("type") or info.get("category", ""),
-                "source": f"內建{jurisdiction}法規資料庫",
-            }
-            # 加入額外欄位（如 celex, pcode）
-            for key in ["celex", "pcode"]:
-                if key in info:
-                    result[key] = info[key]
-            matched.append(result)
+        if law_name not in hits:
+            continue
+
+        result = {
+            "title": law_name,
+            "name_zh": info.get("name_zh", ""),
+            "url": info.get("url", ""),
+            "jurisdiction": jurisdiction,
+            "type": info.get("type") or info.get("category", ""),
+            "source": f"內建{jurisdiction}法規資料庫",
+        }
+        # 加入額外欄位（如 celex, pcode）
+        for key in ["celex", "pcode"]:
+            if key in info:
+                result[key] = info[key]
+        matched.append(result)
 
     return matched
 
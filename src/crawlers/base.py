@@ -4,7 +4,9 @@
 定義爬蟲的抽象介面與共用功能。
 """
 
+import asyncio
 import hashlib
+import importlib.util
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -12,8 +14,18 @@ from typing import Optional
 
 import httpx
 
+# 共用連線池設定
+_CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_PER_HOST_CONCURRENCY = 8
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_DEFAULT_HEADERS = {
+    "User-Agent": "RegulationComplianceAgent/1.0",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "zh-TW,zh;q=0.9,en;q=0.8",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class CrawlerResult:
     """
     爬蟲結果資料類別
@@ -47,6 +59,70 @@ class CrawlerResult:
         }
 
 
+class _SharedClient:
+    """同一事件迴圈內共用的 HTTP 客戶端，附帶每個主機的併發上限"""
+
+    __slots__ = ("key", "loop", "client", "refcount", "_host_semaphores")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, timeout: int):
+        self.key = (id(loop), timeout)
+        self.loop = loop
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            headers=_DEFAULT_HEADERS,
+            limits=_CLIENT_LIMITS,
+            http2=_HTTP2_AVAILABLE,
+        )
+        self.refcount = 0
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """取得目標主機的併發限制"""
+        host = httpx.URL(url).host
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(_PER_HOST_CONCURRENCY)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+
+class _ClientRegistry:
+    """
+    共用 HTTP 客戶端登錄表
+
+    httpx.AsyncClient 綁定於建立時的事件迴圈，因此依 (事件迴圈, timeout) 分組；
+    同時開啟的爬蟲共用同一個連線池，最後一個使用者關閉時才釋放連線。
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple[int, int], _SharedClient] = {}
+
+    def acquire(self, timeout: int) -> _SharedClient:
+        """取得 (必要時建立) 目前事件迴圈的共用客戶端"""
+        loop = asyncio.get_running_loop()
+        key = (id(loop), timeout)
+        entry = self._entries.get(key)
+        if entry is None or entry.loop is not loop or entry.client.is_closed:
+            entry = _SharedClient(loop, timeout)
+            self._entries[key] = entry
+        entry.refcount += 1
+        return entry
+
+    async def release(self, entry: _SharedClient) -> None:
+        """歸還共用客戶端，沒有使用者時關閉連線"""
+        entry.refcount -= 1
+        if entry.refcount > 0:
+            return
+
+        if self._entries.get(entry.key) is entry:
+            del self._entries[entry.key]
+        await entry.client.aclose()
+
+
+_client_registry = _ClientRegistry()
+
+
 class BaseCrawler(ABC):
     """
     爬蟲基礎抽象類別
@@ -71,7 +147,7 @@ class BaseCrawler(ABC):
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._client: Optional[httpx.AsyncClient] = None
+        self._shared: Optional[_SharedClient] = None
 
     @property
     @abstractmethod
@@ -86,51 +162,47 @@ class BaseCrawler(ABC):
         pass
 
     async def get_client(self) -> httpx.AsyncClient:
-        """取得 HTTP 客戶端"""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={
-                    "User-Agent": "RegulationComplianceAgent/1.0",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "zh-TW,zh;q=0.9,en;q=0.8",
-                },
-            )
-        return self._client
+        """取得 HTTP 客戶端 (同一事件迴圈內的爬蟲共用連線池)"""
+        if self._shared is None:
+            self._shared = _client_registry.acquire(self.timeout)
+        return self._shared.client
 
     async def close(self):
-        """關閉 HTTP 客戶端"""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """釋放 HTTP 客戶端"""
+        if self._shared is not None:
+            shared, self._shared = self._shared, None
+            await _client_registry.release(shared)
 
     async def fetch_url(
         self,
         url: str,
         method: str = "GET",
         **kwargs,
-    ) -> tuple[str, int]:
+    ) -> tuple[bytes, int, Optional[str]]:
         """
         擷取 URL 內容
 
+        回傳原始位元組，不經 httpx 的文字解碼；HTML 解析器可直接處理
+        位元組並依 meta 標籤判斷編碼，省去一次完整的解碼。
+        只有 Content-Type 標頭宣告 charset 時才回傳編碼，未宣告時回傳 None 交由解析器判斷。
+
         Args:
             url: 目標 URL
             method: HTTP 方法
             **kwargs: 傳遞給 httpx 的額外參數
 
         Returns:
-            (內容, 狀態碼)
+            (原始內容, 狀態碼, 標頭宣告的編碼或 None)
         """
-        import asyncio
-
         client = await self.get_client()
+        semaphore = self._shared.host_semaphore(url)
         last_error = None
 
         for attempt in range(self.max_retries):
             try:
-                response = await client.request(method, url, **kwargs)
-                return response.text, response.status_code
+                async with semaphore:
+                    response = await client.request(method, url, **kwargs)
+                return response.content, response.status_code, response.charset_encoding
 
             except httpx.HTTPError as e:
                 last_error = e
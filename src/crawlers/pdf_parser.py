@@ -9,10 +9,14 @@ PDF 解析器模組
 """
 
 import io
+import mmap
+import os
 import re
+import tempfile
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 from urllib.parse import urlparse
 
 import httpx
@@ -21,8 +25,20 @@ from pdfplumber.page import Page
 
 from .base import CrawlerResult
 
+# 下載串流的區塊大小
+_DOWNLOAD_CHUNK_SIZE = 65536
 
-@dataclass
+# 文字清理：一次掃描同時處理頁首頁碼、頁尾頁碼、句號換行與空白壓縮
+_CLEAN_TEXT_RE = re.compile(
+    r"(\A\s*第\s*\d+\s*頁\s*)"    # 1: 開頭的頁碼
+    r"|(\s*第\s*\d+\s*頁\s*\Z)"   # 2: 結尾的頁碼
+    r"|(。\s+)"                     # 3: 句號後的空白
+    r"|(\s+)"                       # 4: 其他空白
+)
+_CLEAN_TEXT_REPLACEMENTS = ("", "", "", "。\n", " ")
+
+
+@dataclass(slots=True)
 class PDFPage:
     """PDF 單頁內容"""
     page_number: int
@@ -31,7 +47,7 @@ class PDFPage:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFDocument:
     """PDF 文件結構"""
     filename: str
@@ -76,6 +92,7 @@ class PDFParser:
         timeout: int = 60,
         max_pages: Optional[int] = None,
         extract_tables: bool = True,
+        max_bytes: Optional[int] = 100 * 1024 * 1024,
     ):
         """
         初始化 PDF 解析器
@@ -84,40 +101,79 @@ class PDFParser:
             timeout: 下載超時時間 (秒)
             max_pages: 最大解析頁數 (None 表示全部)
             extract_tables: 是否提取表格
+            max_bytes: 下載檔案大小上限 (None 表示不限制)
         """
         self.timeout = timeout
         self.max_pages = max_pages
         self.extract_tables = extract_tables
+        self.max_bytes = max_bytes
 
-    async def download_pdf(self, url: str) -> bytes:
+    async def _iter_pdf_chunks(self, url: str) -> AsyncIterator[bytes]:
         """
-        從 URL 下載 PDF 檔案
+        以串流方式下載 PDF，驗證通過後逐塊產生內容
+
+        先檢查標頭再讀取內容，非 PDF 回應不會整份載入記憶體。
 
         Args:
             url: PDF 檔案 URL
 
-        Returns:
-            PDF 二進位內容
+        Yields:
+            PDF 內容區塊
         """
         async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
+            async with client.stream(
+                "GET",
                 url,
                 follow_redirects=True,
                 headers={
                     "User-Agent": "RegulationComplianceAgent/1.0",
                     "Accept": "application/pdf,*/*",
                 },
-            )
-            response.raise_for_status()
-
-            # 驗證是否為 PDF
-            content_type = response.headers.get("content-type", "")
-            if "pdf" not in content_type.lower() and not url.lower().endswith(".pdf"):
-                # 嘗試檢查檔案魔術數字
-                if not response.content.startswith(b"%PDF"):
+            ) as response:
+                response.raise_for_status()
+
+                content_type = response.headers.get("content-type", "")
+                declared_pdf = "pdf" in content_type.lower() or url.lower().endswith(".pdf")
+
+                content_length = response.headers.get("content-length", "")
+                if self.max_bytes and content_length.isdigit() and int(content_length) > self.max_bytes:
+                    raise ValueError(f"PDF 檔案過大: {content_length} bytes")
+
+                # 標頭未宣告為 PDF 時，先暫存開頭區塊以檢查檔案魔術數字
+                pending: list[bytes] = []
+                received = 0
+                async for chunk in response.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    received += len(chunk)
+                    if self.max_bytes and received > self.max_bytes:
+                        raise ValueError(f"PDF 檔案超過大小上限: {self.max_bytes} bytes")
+
+                    if declared_pdf:
+                        yield chunk
+                        continue
+
+                    pending.append(chunk)
+                    if received >= 4:
+                        head = b"".join(pending)
+                        if not head.startswith(b"%PDF"):
+                            raise ValueError(f"下載的檔案不是 PDF 格式: {content_type}")
+                        declared_pdf = True
+                        pending = []
+                        yield head
+
+                if not declared_pdf:
                     raise ValueError(f"下載的檔案不是 PDF 格式: {content_type}")
 
-            return response.content
+    async def download_pdf(self, url: str) -> bytes:
+        """
+        從 URL 下載 PDF 檔案
+
+        Args:
+            url: PDF 檔案 URL
+
+        Returns:
+            PDF 二進位內容
+        """
+        return b"".join([chunk async for chunk in self._iter_pdf_chunks(url)])
 
     def parse_from_bytes(
         self,
@@ -134,27 +190,7 @@ class PDFParser:
         Returns:
             PDFDocument 結構
         """
-        pages = []
-
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            metadata = pdf.metadata or {}
-            total_pages = len(pdf.pages)
-
-            # 決定要解析的頁數
-            pages_to_parse = pdf.pages
-            if self.max_pages:
-                pages_to_parse = pdf.pages[:self.max_pages]
-
-            for page in pages_to_parse:
-                page_content = self._extract_page_content(page)
-                pages.append(page_content)
-
-        return PDFDocument(
-            filename=filename,
-            total_pages=total_pages,
-            pages=pages,
-            metadata=metadata,
-        )
+        return self._parse_stream(io.BytesIO(pdf_bytes), filename)
 
     def parse_from_file(self, filepath: str | Path) -> PDFDocument:
         """
@@ -170,15 +206,14 @@ class PDFParser:
         if not filepath.exists():
             raise FileNotFoundError(f"檔案不存在: {filepath}")
 
-        with open(filepath, "rb") as f:
-            pdf_bytes = f.read()
-
-        return self.parse_from_bytes(pdf_bytes, filename=filepath.name)
+        return self._parse_mapped_file(filepath, filepath.name)
 
     async def parse_from_url(self, url: str) -> PDFDocument:
         """
         從 URL 下載並解析 PDF
 
+        下載內容直接寫入暫存檔，解析時再映射回記憶體，大型文件不需整份常駐。
+
         Args:
             url: PDF 檔案 URL
 
@@ -189,11 +224,61 @@ class PDFParser:
         parsed = urlparse(url)
         filename = Path(parsed.path).name or "document.pdf"
 
-        # 下載 PDF
-        pdf_bytes = await self.download_pdf(url)
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            tmp_path = Path(tmp.name)
+
+        try:
+            # 下載 PDF 至暫存檔
+            with open(tmp_path, "wb") as f:
+                async for chunk in self._iter_pdf_chunks(url):
+                    f.write(chunk)
+
+            # 解析 PDF
+            return self._parse_mapped_file(tmp_path, filename)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _parse_mapped_file(self, filepath: Path, filename: str) -> PDFDocument:
+        """以唯讀記憶體映射開啟檔案並解析，頁面內容由作業系統按需分頁載入"""
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"PDF 檔案為空: {filepath}")
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self._parse_stream(mapped, filename)
 
-        # 解析 PDF
-        return self.parse_from_bytes(pdf_bytes, filename=filename)
+    def _parse_stream(self, stream: BinaryIO | mmap.mmap, filename: str) -> PDFDocument:
+        """
+        解析 PDF 資料流
+
+        Args:
+            stream: 可 seek 的二進位資料流
+            filename: 檔案名稱
+
+        Returns:
+            PDFDocument 結構
+        """
+        pages = []
+
+        with pdfplumber.open(stream) as pdf:
+            metadata = pdf.metadata or {}
+            total_pages = len(pdf.pages)
+
+            # 決定要解析的頁數
+            pages_to_parse = pdf.pages
+            if self.max_pages:
+                pages_to_parse = pdf.pages[:self.max_pages]
+
+            for page in pages_to_parse:
+                page_content = self._extract_page_content(page)
+                pages.append(page_content)
+
+        return PDFDocument(
+            filename=filename,
+            total_pages=total_pages,
+            pages=pages,
+            metadata=metadata,
+        )
 
     def _extract_page_content(self, page: Page) -> PDFPage:
         """
@@ -243,15 +328,8 @@ class PDFParser:
         Returns:
             清理後的文字
         """
-        # 移除多餘空白
-        text = re.sub(r"\s+", " ", text)
-
-        # 移除頁首頁尾常見模式 (可根據需要擴充)
-        text = re.sub(r"^\s*第\s*\d+\s*頁\s*", "", text, flags=re.MULTILINE)
-        text = re.sub(r"\s*第\s*\d+\s*頁\s*$", "", text, flags=re.MULTILINE)
-
-        # 修正中文標點
-        text = text.replace("。 ", "。\n")
+        # 單次掃描：壓縮空白、移除頁首頁尾頁碼、句號後換行
+        text = _CLEAN_TEXT_RE.sub(lambda m: _CLEAN_TEXT_REPLACEMENTS[m.lastindex], text)
 
         return text.strip()
 
@@ -6,12 +6,15 @@
 
 import re
 from typing import Optional
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 from bs4 import BeautifulSoup
 
 from .base import BaseCrawler, CrawlerResult
 
+# 搜尋結果連結中的法規代碼
+_PCODE_RE = re.compile(r"pcode=([A-Z0-9]+)")
+
 
 class TaiwanLawsCrawler(BaseCrawler):
     """
@@ -20,6 +23,12 @@ class TaiwanLawsCrawler(BaseCrawler):
     網站: https://law.moj.gov.tw/
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 預先拆解 base_url，供搜尋結果的相對連結直接組合
+        base_parts = urlsplit(self.base_url)
+        self._base_origin = f"{base_parts.scheme}://{base_parts.netloc}"
+
     @property
     def source_name(self) -> str:
         return "全國法規資料庫"
@@ -49,7 +58,7 @@ class TaiwanLawsCrawler(BaseCrawler):
         search_url = f"{self.base_url}/LawClass/LawSearchContent.aspx"
 
         try:
-            content, status_code = await self.fetch_url(
+            content, status_code, encoding = await self.fetch_url(
                 search_url,
                 params={
                     "keyword": query,
@@ -60,7 +69,7 @@ class TaiwanLawsCrawler(BaseCrawler):
             if status_code != 200:
                 return []
 
-            return self._parse_search_results(content, limit)
+            return self._parse_search_results(content, limit, encoding)
 
         except Exception as e:
             print(f"搜尋失敗: {e}")
@@ -68,11 +77,12 @@ class TaiwanLawsCrawler(BaseCrawler):
 
     def _parse_search_results(
         self,
-        html: str,
+        html: bytes | str,
         limit: int,
+        encoding: Optional[str] = None,
     ) -> list[dict]:
         """解析搜尋結果頁面"""
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", from_encoding=encoding)
         results = []
 
         # 尋找搜尋結果表格
@@ -94,13 +104,13 @@ class TaiwanLawsCrawler(BaseCrawler):
                 href = link.get("href", "")
 
                 # 提取法規代碼
-                pcode_match = re.search(r"pcode=([A-Z0-9]+)", href)
+                pcode_match = _PCODE_RE.search(href)
                 pcode = pcode_match.group(1) if pcode_match else None
 
                 results.append({
                     "title": title,
                     "pcode": pcode,
-                    "url": urljoin(self.base_url, href),
+                    "url": self._absolute_url(href),
                 })
 
             except Exception:
@@ -108,6 +118,12 @@ class TaiwanLawsCrawler(BaseCrawler):
 
         return results
 
+    def _absolute_url(self, href: str) -> str:
+        """將搜尋結果連結轉為絕對 URL（站內根路徑直接組合，其餘交給 urljoin）"""
+        if href.startswith("/") and not href.startswith("//"):
+            return self._base_origin + href
+        return urljoin(self.base_url, href)
+
     async def get_regulation(
         self,
         regulation_id: str,
@@ -125,7 +141,7 @@ class TaiwanLawsCrawler(BaseCrawler):
         law_url = f"{self.base_url}/LawClass/LawAll.aspx?pcode={regulation_id}"
 
         try:
-            content, status_code = await self.fetch_url(law_url)
+            content, status_code, encoding = await self.fetch_url(law_url)
 
             if status_code != 200:
                 return CrawlerResult(
@@ -138,7 +154,7 @@ class TaiwanLawsCrawler(BaseCrawler):
                 )
 
             # 解析法規內容
-            parsed = self._parse_law_page(content, law_url)
+            parsed = self._parse_law_page(content, law_url, encoding)
 
             return CrawlerResult(
                 status="success",
@@ -168,20 +184,22 @@ class TaiwanLawsCrawler(BaseCrawler):
 
     def _parse_law_page(
         self,
-        html: str,
+        html: bytes | str,
         url: str,
+        encoding: Optional[str] = None,
     ) -> dict:
         """
         解析法規頁面
 
         Args:
-            html: 頁面 HTML
+            html: 頁面 HTML (原始位元組或字串)
             url: 頁面 URL
+            encoding: 回應標頭宣告的編碼（未宣告時為 None，由解析器依 meta 標籤判斷）
 
         Returns:
             解析後的法規資料
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, "lxml", from_encoding=encoding)
 
         result = {
             "title": "",
@@ -19,6 +19,7 @@ from .models import (
     get_database_path,
     get_engine,
     get_session,
+    get_session_factory,
     init_database,
 )
 from .seed_data import seed_all
@@ -39,6 +40,7 @@ __all__ = [
     # 資料庫函數
     "get_engine",
     "get_session",
+    "get_session_factory",
     "init_database",
     "get_database_path",
     # 管理工具
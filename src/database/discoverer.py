@@ -8,219 +8,250 @@
 - 自動比對並新增資料庫中沒有的法規
 """
 
+import importlib.util
 import json
+import os
 import re
+import threading
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
 
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from ..utils.cache import QueryCache
+from ..utils.keyword_matcher import KeywordMatcher
 from .manager import BaselineManager
 from .models import RegulationBaseline, get_session
+from .name_index import RegulationNameIndex, jaccard, name_tokens, normalize_name
+
+# LLM 解析結果快取位置與有效期
+_LLM_CACHE_DIR = ".cache/discovery_llm"
+_LLM_CACHE_TTL_HOURS = 24 * 30
+
+
+class Source(NamedTuple):
+    """監管機構搜尋來源"""
+    name: str
+    name_en: str
+    url: str
+    search_queries: Tuple[str, ...]
+    industries: Tuple[str, ...]
 
-# === 監管機構網站清單 ===
 
-REGULATORY_SOURCES = {
+# === 監管機構網站清單（唯讀） ===
+
+REGULATORY_SOURCES: Mapping[str, Tuple[Source, ...]] = MappingProxyType({
     # 台灣
-    "TW": [
-        {
-            "name": "金融監督管理委員會",
-            "name_en": "Financial Supervisory Commission",
-            "url": "https://www.fsc.gov.tw",
-            "search_queries": [
+    "TW": (
+        Source(
+            name="金融監督管理委員會",
+            name_en="Financial Supervisory Commission",
+            url="https://www.fsc.gov.tw",
+            search_queries=(
                 "金管會 資安 法規 最新",
                 "金管會 個資 法規 2024",
                 "台灣 金融資安 新規定",
-            ],
-            "industries": ["finance_general", "banking", "securities", "insurance"],
-        },
-        {
-            "name": "數位發展部",
-            "name_en": "Ministry of Digital Affairs",
-            "url": "https://moda.gov.tw",
-            "search_queries": [
+            ),
+            industries=("finance_general", "banking", "securities", "insurance"),
+        ),
+        Source(
+            name="數位發展部",
+            name_en="Ministry of Digital Affairs",
+            url="https://moda.gov.tw",
+            search_queries=(
                 "數位發展部 資通安全 法規",
                 "台灣 資安法 修正",
-            ],
-            "industries": ["technology", "telecom"],
-        },
-        {
-            "name": "國家通訊傳播委員會",
-            "name_en": "National Communications Commission",
-            "url": "https://www.ncc.gov.tw",
-            "search_queries": [
+            ),
+            industries=("technology", "telecom"),
+        ),
+        Source(
+            name="國家通訊傳播委員會",
+            name_en="National Communications Commission",
+            url="https://www.ncc.gov.tw",
+            search_queries=(
                 "NCC 電信 資安 法規",
-            ],
-            "industries": ["telecom"],
-        },
-    ],
+            ),
+            industries=("telecom",),
+        ),
+    ),
     # 日本
-    "JP": [
-        {
-            "name": "金融庁",
-            "name_en": "Financial Services Agency",
-            "url": "https://www.fsa.go.jp",
-            "search_queries": [
+    "JP": (
+        Source(
+            name="金融庁",
+            name_en="Financial Services Agency",
+            url="https://www.fsa.go.jp",
+            search_queries=(
                 "金融庁 サイバーセキュリティ ガイドライン 最新",
                 "金融庁 情報セキュリティ 監督指針",
-            ],
-            "industries": ["finance_general", "banking", "securities", "insurance"],
-        },
-        {
-            "name": "個人情報保護委員会",
-            "name_en": "Personal Information Protection Commission",
-            "url": "https://www.ppc.go.jp",
-            "search_queries": [
+            ),
+            industries=("finance_general", "banking", "securities", "insurance"),
+        ),
+        Source(
+            name="個人情報保護委員会",
+            name_en="Personal Information Protection Commission",
+            url="https://www.ppc.go.jp",
+            search_queries=(
                 "個人情報保護法 改正 最新",
-            ],
-            "industries": ["finance_general", "healthcare", "technology"],
-        },
-    ],
+            ),
+            industries=("finance_general", "healthcare", "technology"),
+        ),
+    ),
     # 新加坡
-    "SG": [
-        {
-            "name": "Monetary Authority of Singapore",
-            "name_en": "MAS",
-            "url": "https://www.mas.gov.sg",
-            "search_queries": [
+    "SG": (
+        Source(
+            name="Monetary Authority of Singapore",
+            name_en="MAS",
+            url="https://www.mas.gov.sg",
+            search_queries=(
                 "MAS technology risk management guidelines latest",
                 "MAS cybersecurity notice 2024",
                 "MAS TRM guidelines update",
-            ],
-            "industries": ["finance_general", "banking", "securities", "insurance", "fintech"],
-        },
-        {
-            "name": "Personal Data Protection Commission",
-            "name_en": "PDPC",
-            "url": "https://www.pdpc.gov.sg",
-            "search_queries": [
+            ),
+            industries=("finance_general", "banking", "securities", "insurance", "fintech"),
+        ),
+        Source(
+            name="Personal Data Protection Commission",
+            name_en="PDPC",
+            url="https://www.pdpc.gov.sg",
+            search_queries=(
                 "Singapore PDPA amendment latest",
-            ],
-            "industries": ["finance_general", "technology", "healthcare"],
-        },
-    ],
+            ),
+            industries=("finance_general", "technology", "healthcare"),
+        ),
+    ),
     # 香港
-    "HK": [
-        {
-            "name": "Hong Kong Monetary Authority",
-            "name_en": "HKMA",
-            "url": "https://www.hkma.gov.hk",
-            "search_queries": [
+    "HK": (
+        Source(
+            name="Hong Kong Monetary Authority",
+            name_en="HKMA",
+            url="https://www.hkma.gov.hk",
+            search_queries=(
                 "HKMA technology risk supervisory policy manual",
                 "HKMA cybersecurity circular latest",
-            ],
-            "industries": ["finance_general", "banking"],
-        },
-    ],
+            ),
+            industries=("finance_general", "banking"),
+        ),
+    ),
     # 歐盟
-    "EU": [
-        {
-            "name": "European Commission",
-            "name_en": "EC",
-            "url": "https://ec.europa.eu",
-            "search_queries": [
+    "EU": (
+        Source(
+            name="European Commission",
+            name_en="EC",
+            url="https://ec.europa.eu",
+            search_queries=(
                 "EU DORA regulation implementation",
                 "EU NIS2 directive latest",
                 "EU AI Act regulation",
                 "EU Cyber Resilience Act",
-            ],
-            "industries": ["finance_general", "technology", "healthcare", "energy"],
-        },
-        {
-            "name": "European Banking Authority",
-            "name_en": "EBA",
-            "url": "https://www.eba.europa.eu",
-            "search_queries": [
+            ),
+            industries=("finance_general", "technology", "healthcare", "energy"),
+        ),
+        Source(
+            name="European Banking Authority",
+            name_en="EBA",
+            url="https://www.eba.europa.eu",
+            search_queries=(
                 "EBA ICT risk guidelines latest",
                 "EBA outsourcing guidelines",
-            ],
-            "industries": ["banking", "finance_general"],
-        },
-    ],
+            ),
+            industries=("banking", "finance_general"),
+        ),
+    ),
     # 美國
-    "US": [
-        {
-            "name": "Securities and Exchange Commission",
-            "name_en": "SEC",
-            "url": "https://www.sec.gov",
-            "search_queries": [
+    "US": (
+        Source(
+            name="Securities and Exchange Commission",
+            name_en="SEC",
+            url="https://www.sec.gov",
+            search_queries=(
                 "SEC cybersecurity disclosure rule 2024",
                 "SEC cyber risk management regulation",
-            ],
-            "industries": ["securities", "finance_general"],
-        },
-        {
-            "name": "Federal Financial Institutions Examination Council",
-            "name_en": "FFIEC",
-            "url": "https://www.ffiec.gov",
-            "search_queries": [
+            ),
+            industries=("securities", "finance_general"),
+        ),
+        Source(
+            name="Federal Financial Institutions Examination Council",
+            name_en="FFIEC",
+            url="https://www.ffiec.gov",
+            search_queries=(
                 "FFIEC cybersecurity handbook update",
                 "FFIEC IT examination handbook latest",
-            ],
-            "industries": ["banking", "finance_general"],
-        },
-        {
-            "name": "New York Department of Financial Services",
-            "name_en": "NYDFS",
-            "url": "https://www.dfs.ny.gov",
-            "search_queries": [
+            ),
+            industries=("banking", "finance_general"),
+        ),
+        Source(
+            name="New York Department of Financial Services",
+            name_en="NYDFS",
+            url="https://www.dfs.ny.gov",
+            search_queries=(
                 "23 NYCRR 500 amendment 2024",
                 "NYDFS cybersecurity regulation update",
-            ],
-            "industries": ["finance_general", "insurance"],
-        },
-    ],
+            ),
+            industries=("finance_general", "insurance"),
+        ),
+    ),
     # 澳洲
-    "AU": [
-        {
-            "name": "Australian Prudential Regulation Authority",
-            "name_en": "APRA",
-            "url": "https://www.apra.gov.au",
-            "search_queries": [
+    "AU": (
+        Source(
+            name="Australian Prudential Regulation Authority",
+            name_en="APRA",
+            url="https://www.apra.gov.au",
+            search_queries=(
                 "APRA CPS 234 update",
                 "APRA CPS 230 operational resilience",
                 "APRA information security standard",
-            ],
-            "industries": ["banking", "insurance", "finance_general"],
-        },
-    ],
+            ),
+            industries=("banking", "insurance", "finance_general"),
+        ),
+    ),
     # 韓國
-    "KR": [
-        {
-            "name": "금융위원회",
-            "name_en": "Financial Services Commission",
-            "url": "https://www.fsc.go.kr",
-            "search_queries": [
+    "KR": (
+        Source(
+            name="금융위원회",
+            name_en="Financial Services Commission",
+            url="https://www.fsc.go.kr",
+            search_queries=(
                 "금융위원회 전자금융 규정 최신",
                 "금융보안원 사이버보안 가이드라인",
-            ],
-            "industries": ["finance_general", "banking", "fintech"],
-        },
-    ],
+            ),
+            industries=("finance_general", "banking", "fintech"),
+        ),
+    ),
     # 中國
-    "CN": [
-        {
-            "name": "中国人民银行",
-            "name_en": "People's Bank of China",
-            "url": "http://www.pbc.gov.cn",
-            "search_queries": [
+    "CN": (
+        Source(
+            name="中国人民银行",
+            name_en="People's Bank of China",
+            url="http://www.pbc.gov.cn",
+            search_queries=(
                 "人民银行 金融数据安全 规定 最新",
                 "银保监会 信息科技 监管",
-            ],
-            "industries": ["banking", "finance_general"],
-        },
-        {
-            "name": "国家互联网信息办公室",
-            "name_en": "Cyberspace Administration of China",
-            "url": "http://www.cac.gov.cn",
-            "search_queries": [
+            ),
+            industries=("banking", "finance_general"),
+        ),
+        Source(
+            name="国家互联网信息办公室",
+            name_en="Cyberspace Administration of China",
+            url="http://www.cac.gov.cn",
+            search_queries=(
                 "网信办 数据安全 法规 最新",
                 "个人信息保护法 实施细则",
-            ],
-            "industries": ["technology", "finance_general"],
-        },
-    ],
-}
+            ),
+            industries=("technology", "finance_general"),
+        ),
+    ),
+})
+
+_ALL_COUNTRIES: Tuple[str, ...] = tuple(REGULATORY_SOURCES)
 
 
 @dataclass
@@ -248,6 +279,121 @@ class DiscoveredRegulation:
             self.applicable_industries = [self.industry_code]
 
 
+# 單次 LLM 呼叫的內容上限 (token)
+_MAX_INPUT_TOKENS = 2000
+
+# 無法載入 tokenizer 時，以每 token 約 2 字元粗估
+_FALLBACK_CHARS_PER_TOKEN = 2
+
+# 標題出現任一關鍵字才視為可能的法規
+_REGULATION_TITLE_MATCHER = KeywordMatcher((keyword, True) for keyword in (
+    "法", "規", "规", "條例", "条例", "辦法", "指引", "準則", "准则", "標準", "标准", "要點",
+    "ガイドライン", "指針", "基準", "법", "규정", "가이드라인",
+    "Act", "Regulation", "Guideline", "Directive", "Rule", "Standard", "Notice",
+    "Circular", "Handbook", "Framework", "Policy", "NYCRR", "CPS",
+))
+
+# 政府機關網域 (.gov、.gov.tw、.go.jp、europa.eu 等)
+_OFFICIAL_HOST_RE = re.compile(r"\.(?:gov|go)(?:\.[a-z]{2})?$|(?:^|\.)europa\.eu$")
+
+
+@lru_cache(maxsize=1)
+def _get_token_encoder():
+    """取得 tokenizer，tiktoken 未安裝或編碼檔無法載入時返回 None"""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """依 token 數截斷文字（無 tokenizer 時改以字元數粗估）"""
+    encoder = _get_token_encoder()
+    if encoder is None:
+        return text[:max_tokens * _FALLBACK_CHARS_PER_TOKEN]
+
+    tokens = encoder.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
+
+def _looks_like_regulation(title: str, url: str, source: Source) -> bool:
+    """呼叫 LLM 前的快速篩選：標題含法規關鍵字，或網址為官方網域"""
+    if _REGULATION_TITLE_MATCHER.contains_any(title):
+        return True
+
+    host = (urlparse(url).hostname or "").lower()
+    return bool(_OFFICIAL_HOST_RE.search(host)) or host == urlparse(source.url).hostname
+
+
+class _HostRateLimiter:
+    """
+    依主機限制請求頻率（每個主機每 interval 秒最多一次）
+
+    各主機獨立計時，不同主機的請求不互相等待；可在多執行緒間共用。
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, host: str):
+        """預約該主機下一個可用時段，必要時睡眠至該時段"""
+        if self.interval <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json(text: str, opening: str = "{[") -> Any:
+    """
+    從 LLM 回應中取出第一個完整的 JSON 值
+
+    由每個可能的起始括號嘗試解碼，可正確處理巢狀結構，也不會有正規表示式回溯問題。
+
+    Args:
+        text: LLM 回應文字
+        opening: 允許的起始字元（"{" 物件、"[" 陣列）
+
+    Returns:
+        解析後的 JSON 值，找不到時返回 None
+    """
+    if not text:
+        return None
+
+    for i, char in enumerate(text):
+        if char in opening:
+            try:
+                return _JSON_DECODER.raw_decode(text, i)[0]
+            except json.JSONDecodeError:
+                continue
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _jaccard_similarity(s1: str, s2: str) -> float:
+    """Jaccard 相似度（以詞為單位，無法分詞時改用字元）"""
+    return jaccard(name_tokens(s1), name_tokens(s2))
+
+
+def _index_matches(index: RegulationNameIndex, name: str) -> bool:
+    """名稱（已正規化）是否與索引中的名稱完全相符或超過 80% 相似"""
+    return index.contains(name) or index.find_similar(name, 0.8) is not None
+
+
 class RegulationDiscoverer:
     """法規自動發現器"""
 
@@ -257,6 +403,7 @@ class RegulationDiscoverer:
         fetch_function: Optional[Callable] = None,
         llm_function: Optional[Callable] = None,
         status_callback: Optional[Callable[[str], None]] = None,
+        use_llm_cache: Optional[bool] = None,
     ):
         """
         初始化發現器
@@ -266,10 +413,26 @@ class RegulationDiscoverer:
             fetch_function: 網頁爬取函數 (預設使用 fetch_url)
             llm_function: LLM 解析函數 (預設使用 Azure OpenAI)
             status_callback: 狀態回調函數
+            use_llm_cache: 是否快取 LLM 解析結果（相同提示與內容不重複呼叫）；
+                預設只在使用內建 LLM 函數時啟用，快取鍵不包含解析函數，自訂函數不應共用
         """
         self.manager = BaselineManager()
         self.status_callback = status_callback or (lambda x: print(x))
 
+        # LLM 解析結果快取（搜尋結果跨次執行多半重複）
+        if use_llm_cache is None:
+            use_llm_cache = llm_function is None
+        self._llm_cache: Optional[QueryCache] = (
+            QueryCache(cache_dir=_LLM_CACHE_DIR, ttl_hours=_LLM_CACHE_TTL_HOURS) if use_llm_cache else None
+        )
+
+        # Azure OpenAI 客戶端（延遲建立，供預設 LLM 函數共用）
+        self._azure_client = None
+        self._azure_client_lock = threading.Lock()
+
+        # 各國既有法規名稱索引（每次發現任務載入一次）
+        self._name_indexes: Dict[str, RegulationNameIndex] = {}
+
         # 預設搜尋函數
         if search_function is None:
             from ..agents.tools import web_search
@@ -294,20 +457,55 @@ class RegulationDiscoverer:
         """報告狀態"""
         self.status_callback(message)
 
-    def _default_llm_parse(self, content: str, prompt: str) -> str:
-        """預設 LLM 解析函數"""
-        try:
-            import os
+    def _call_llm(self, content: str, prompt: str) -> str:
+        """
+        呼叫 LLM 解析函數，命中快取時直接返回先前的回應
 
-            from openai import AzureOpenAI
+        Args:
+            content: 要解析的內容
+            prompt: 提示詞
 
-            client = AzureOpenAI(
-                api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-                api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview"),
-                azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            )
+        Returns:
+            LLM 回應文字
+        """
+        if self._llm_cache is not None:
+            cached = self._llm_cache.get(prompt, content)
+            if cached is not None:
+                return cached["response"]
+
+        response = self.llm_function(content, prompt)
+
+        # 空回應代表呼叫失敗，不寫入快取
+        if response and self._llm_cache is not None:
+            self._llm_cache.set(prompt, content, {"response": response})
+
+        return response
+
+    @property
+    def azure_client(self):
+        """共用的 Azure OpenAI 客戶端（首次使用時建立，連線池跨呼叫重複使用）"""
+        if self._azure_client is None:
+            with self._azure_client_lock:
+                if self._azure_client is None:
+                    import httpx
+                    from openai import AzureOpenAI
+
+                    self._azure_client = AzureOpenAI(
+                        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+                        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview"),
+                        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+                        http_client=httpx.Client(
+                            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                            http2=importlib.util.find_spec("h2") is not None,
+                            timeout=60.0,
+                        ),
+                    )
+        return self._azure_client
 
-            response = client.chat.completions.create(
+    def _default_llm_parse(self, content: str, prompt: str) -> str:
+        """預設 LLM 解析函數"""
+        try:
+            response = self.azure_client.chat.completions.create(
                 model=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o"),
                 messages=[
                     {"role": "system", "content": "你是法規分析專家，擅長從網頁內容中提取法規資訊。"},
@@ -323,83 +521,99 @@ class RegulationDiscoverer:
             self._report(f"  ⚠️ LLM 解析失敗: {str(e)[:50]}")
             return ""
 
-    def _is_regulation_exists(self, name: str, country_code: str) -> bool:
-        """檢查法規是否已存在於資料庫"""
-        session = get_session()
-
-        # 模糊比對：名稱相似度
-        existing = session.query(RegulationBaseline).filter(
-            RegulationBaseline.country_code == country_code,
-            RegulationBaseline.is_active == True,
-        ).all()
+    @contextmanager
+    def _session_scope(self, session=None) -> Iterator[Any]:
+        """沿用呼叫端傳入的 Session，未傳入時開啟並於結束後關閉新的 Session"""
+        if session is not None:
+            yield session
+            return
 
-        session.close()
-
-        # 檢查名稱是否相似
-        name_lower = name.lower().strip()
-        for reg in existing:
-            existing_name = reg.name.lower().strip()
-            existing_en = (reg.name_en or "").lower().strip()
-            existing_zh = (reg.name_zh or "").lower().strip()
-
-            # 完全匹配
-            if name_lower in [existing_name, existing_en, existing_zh]:
-                return True
-
-            # 部分匹配（超過 80% 相似）
-            if self._similarity(name_lower, existing_name) > 0.8:
-                return True
-            if existing_en and self._similarity(name_lower, existing_en) > 0.8:
-                return True
-            if existing_zh and self._similarity(name_lower, existing_zh) > 0.8:
-                return True
+        session = get_session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def _build_name_index(self, country_code: str, session=None) -> RegulationNameIndex:
+        """從資料庫載入某國家所有有效法規名稱，建立名稱索引"""
+        with self._session_scope(session) as s:
+            rows = s.query(
+                RegulationBaseline.name,
+                RegulationBaseline.name_en,
+                RegulationBaseline.name_zh,
+            ).filter(
+                RegulationBaseline.country_code == country_code,
+                RegulationBaseline.is_active.is_(True),
+            ).yield_per(1000)
+
+            index = RegulationNameIndex()
+            for row in rows:
+                index.add(*row)
+        return index
+
+    def _get_name_index(self, country_code: str, session=None) -> RegulationNameIndex:
+        """取得某國家的名稱索引（首次使用時建立）"""
+        index = self._name_indexes.get(country_code)
+        if index is None:
+            index = self._build_name_index(country_code, session)
+            self._name_indexes[country_code] = index
+        return index
+
+    def _is_regulation_exists(
+        self,
+        name: str,
+        country_code: str,
+        pending_index: Optional[RegulationNameIndex] = None,
+    ) -> bool:
+        """
+        檢查法規是否已存在於資料庫
 
-        return False
+        Args:
+            name: 法規名稱
+            country_code: 國家代碼
+            pending_index: 尚未寫入資料庫的待新增法規名稱（一併比對，避免同一批重複）
+        """
+        name_lower = normalize_name(name)
+        indexes = (self._get_name_index(country_code), pending_index)
+        return any(index is not None and _index_matches(index, name_lower) for index in indexes)
 
     def _similarity(self, s1: str, s2: str) -> float:
         """計算兩個字串的相似度（簡單版本）"""
         if not s1 or not s2:
             return 0.0
 
-        # 使用 Jaccard 相似度
-        set1 = set(s1.split())
-        set2 = set(s2.split())
-
-        if not set1 or not set2:
-            # 如果無法分詞，使用字元級別比對
-            set1 = set(s1)
-            set2 = set(s2)
-
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-
-        return intersection / union if union > 0 else 0.0
+        # 相似度對稱，排序後共用同一個快取項目
+        if s2 < s1:
+            s1, s2 = s2, s1
+        return _jaccard_similarity(s1, s2)
 
-    def _parse_search_results(
+    def _iter_parse_search_results(
         self,
-        search_results: List[Dict],
+        search_results: Iterable[Dict],
         country_code: str,
-        source_info: Dict,
-    ) -> List[DiscoveredRegulation]:
-        """解析搜尋結果，提取法規資訊"""
-        discovered = []
-
-        for result in search_results[:5]:  # 只處理前 5 筆結果
-            title = result.get("title", "")
-            url = result.get("url", "")
-            snippet = result.get("snippet", "")
+        source_info: Source,
+        query: str = "",
+        *,
+        limit: int = 5,
+    ) -> Iterator[DiscoveredRegulation]:
+        """
+        解析搜尋結果，逐筆產生判定為法規的項目
 
-            if not title:
-                continue
+        Args:
+            search_results: 搜尋結果
+            country_code: 國家代碼
+            source_info: 監管機構來源
+            query: 產生這些結果的查詢字串
+            limit: 最多處理的結果筆數
 
-            # 使用 LLM 判斷是否為法規
-            prompt = f"""
-請分析以下搜尋結果，判斷是否為正式的法規、指引或監管規定。
+        Yields:
+            發現的法規
+        """
+        # 搜尋結果本身只放在內容中傳送一次，提示詞對同一來源固定不變
+        prompt = f"""
+請分析內容中的搜尋結果，判斷是否為正式的法規、指引或監管規定。
 
-標題: {title}
-網址: {url}
-摘要: {snippet}
-來源機構: {source_info.get('name', '')}
+來源機構: {source_info.name}
 國家: {country_code}
 
 如果這是一個法規/指引/規定，請提取以下資訊並以 JSON 格式回覆：
@@ -416,53 +630,67 @@ class RegulationDiscoverer:
 如果不是法規，回覆：{{"is_regulation": false}}
 """
 
+        for result in islice(search_results, limit):
+            title = result.get("title", "")
+            url = result.get("url", "")
+            snippet = result.get("snippet", "")
+
+            if not title:
+                continue
+
+            # 標題與網址都不像法規時不呼叫 LLM
+            if not _looks_like_regulation(title, url, source_info):
+                continue
+
+            # 使用 LLM 判斷是否為法規
             try:
-                llm_response = self.llm_function(f"標題: {title}\n摘要: {snippet}", prompt)
+                llm_response = self._call_llm(f"標題: {title}\n網址: {url}\n摘要: {snippet}", prompt)
 
                 # 解析 JSON
-                json_match = re.search(r'\{[^{}]*\}', llm_response, re.DOTALL)
-                if json_match:
-                    data = json.loads(json_match.group())
-
+                data = _extract_json(llm_response, "{")
+                if isinstance(data, dict):
                     if data.get("is_regulation"):
                         reg = DiscoveredRegulation(
                             name=data.get("name", title),
                             name_en=data.get("name_en"),
                             name_zh=data.get("name_zh"),
                             country_code=country_code,
-                            industry_code=source_info.get("industries", ["finance_general"])[0],
+                            industry_code=source_info.industries[0],
                             topic_code=data.get("topic", "cybersecurity"),
                             regulation_type=data.get("regulation_type"),
-                            issuing_authority=source_info.get("name"),
+                            issuing_authority=source_info.name,
                             official_url=url,
                             summary=data.get("summary"),
-                            applicable_industries=source_info.get("industries", ["finance_general"]),
+                            applicable_industries=list(source_info.industries),
                             confidence_score=0.6,
-                            source_query=result.get("query", ""),
+                            source_query=query,
                         )
-                        discovered.append(reg)
+                        yield reg
 
             except Exception as e:
                 self._report(f"  ⚠️ 解析失敗: {str(e)[:30]}")
                 continue
 
-        return discovered
-
     def discover_by_search(
         self,
         country_code: str = None,
         max_queries_per_source: int = 2,
         delay_seconds: float = 1.0,
         verbose: bool = True,
+        max_workers: int = 8,
     ) -> Dict[str, Any]:
         """
         使用搜尋引擎發現新法規
 
+        搜尋與 LLM 解析在執行緒池中並行執行；比對與寫入資料庫仍在呼叫端執行緒，
+        依查詢順序逐筆處理，結果與循序執行一致。
+
         Args:
             country_code: 指定國家（None = 全部）
             max_queries_per_source: 每個來源最多執行幾個查詢
-            delay_seconds: 查詢間隔
+            delay_seconds: 同一監管機構網站的查詢間隔（秒）
             verbose: 是否顯示詳細進度
+            max_workers: 並行查詢的執行緒數
 
         Returns:
             發現結果摘要
@@ -479,97 +707,81 @@ class RegulationDiscoverer:
         }
 
         # 決定要搜尋的國家
-        countries = [country_code] if country_code else list(REGULATORY_SOURCES.keys())
+        countries = (country_code,) if country_code else _ALL_COUNTRIES
+
+        # 每次任務重新載入既有法規名稱
+        self._name_indexes.clear()
 
         if verbose:
             self._report(f"開始搜尋 {len(countries)} 個國家/地區的法規...")
             self._report("=" * 60)
 
-        for cc in countries:
-            sources = REGULATORY_SOURCES.get(cc, [])
+        # 攤平為 (國家, 來源, 查詢) 任務清單
+        tasks = [
+            (cc, source, query)
+            for cc in countries
+            for source in REGULATORY_SOURCES.get(cc, ())
+            for query in source.search_queries[:max_queries_per_source]
+        ]
+
+        with self._session_scope() as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            limiter = _HostRateLimiter(delay_seconds)
+            outcomes = executor.map(lambda task: self._run_search_query(*task, limiter), tasks)
+
+            current_cc = None
+            current_source = None
+            pending: List[DiscoveredRegulation] = []
+            pending_index = RegulationNameIndex()
+
+            for (cc, source, query), (discovered, error) in zip(tasks, outcomes):
+                if cc != current_cc:
+                    # 換國家前先批次寫入上一個國家的新法規，並載入此國家的既有名稱
+                    self._flush_pending(session, pending, results, verbose)
+                    pending_index = RegulationNameIndex()
+                    current_cc = cc
+                    self._get_name_index(cc, session)
+                    if verbose:
+                        self._report(f"\n[{cc}] 搜尋 {len(REGULATORY_SOURCES.get(cc, ()))} 個監管機構...")
 
-            if verbose:
-                self._report(f"\n[{cc}] 搜尋 {len(sources)} 個監管機構...")
+                if source is not current_source:
+                    current_source = source
+                    if verbose:
+                        self._report(f"  📍 {source.name}")
 
-            for source in sources:
-                source_name = source.get("name", "Unknown")
-                queries = source.get("search_queries", [])[:max_queries_per_source]
+                results["total_queries"] += 1
 
                 if verbose:
-                    self._report(f"  📍 {source_name}")
-
-                for query in queries:
-                    results["total_queries"] += 1
+                    self._report(f"    🔍 搜尋: {query[:40]}...")
 
+                if error is not None:
+                    results["errors"].append({
+                        "query": query,
+                        "error": error,
+                    })
                     if verbose:
-                        self._report(f"    🔍 搜尋: {query[:40]}...")
-
-                    try:
-                        # 執行搜尋
-                        search_result = self.search_function(query, num_results=5)
-                        data = json.loads(search_result) if isinstance(search_result, str) else search_result
-
-                        if data.get("status") == "success":
-                            search_results = data.get("results", [])
-
-                            # 為每個結果加入查詢資訊
-                            for r in search_results:
-                                r["query"] = query
-
-                            # 解析結果
-                            discovered = self._parse_search_results(
-                                search_results, cc, source
-                            )
-
-                            for reg in discovered:
-                                results["total_discovered"] += 1
-
-                                # 檢查是否已存在
-                                if self._is_regulation_exists(reg.name, cc):
-                                    results["existing_regulations"] += 1
-                                    results["skipped_regulations"].append({
-                                        "name": reg.name,
-                                        "country": cc,
-                                        "reason": "已存在",
-                                    })
-                                    if verbose:
-                                        self._report(f"      ⏭️ 已存在: {reg.name[:30]}...")
-                                else:
-                                    # 新增到資料庫
-                                    try:
-                                        self._add_regulation(reg)
-                                        results["new_regulations"] += 1
-                                        results["added_regulations"].append({
-                                            "name": reg.name,
-                                            "country": cc,
-                                            "url": reg.official_url,
-                                        })
-                                        if verbose:
-                                            self._report(f"      ✅ 新增: {reg.name[:30]}...")
-                                    except Exception as e:
-                                        results["errors"].append({
-                                            "name": reg.name,
-                                            "error": str(e),
-                                        })
-                                        if verbose:
-                                            self._report(f"      ❌ 新增失敗: {str(e)[:30]}")
-
-                        else:
-                            results["errors"].append({
-                                "query": query,
-                                "error": data.get("error", "搜尋失敗"),
-                            })
-
-                    except Exception as e:
-                        results["errors"].append({
-                            "query": query,
-                            "error": str(e),
+                        self._report(f"      ❌ 錯誤: {error[:30]}")
+                    continue
+
+                for reg in discovered:
+                    results["total_discovered"] += 1
+
+                    # 檢查是否已存在
+                    if self._is_regulation_exists(reg.name, cc, pending_index):
+                        results["existing_regulations"] += 1
+                        results["skipped_regulations"].append({
+                            "name": reg.name,
+                            "country": cc,
+                            "reason": "已存在",
                         })
                         if verbose:
-                            self._report(f"      ❌ 錯誤: {str(e)[:30]}")
+                            self._report(f"      ⏭️ 已存在: {reg.name[:30]}...")
+                    else:
+                        # 待國家結束時批次新增；寫入成功後才加入國家的名稱索引，
+                        # 在此之前以待新增索引避免同一批重複
+                        pending.append(reg)
+                        pending_index.add(reg.name, reg.name_en, reg.name_zh)
 
-                    # 延遲避免限流
-                    time.sleep(delay_seconds)
+            self._flush_pending(session, pending, results, verbose)
 
         # 顯示摘要
         if verbose:
@@ -583,11 +795,109 @@ class RegulationDiscoverer:
 
         return results
 
-    def _add_regulation(self, reg: DiscoveredRegulation):
-        """將發現的法規新增到資料庫"""
-        session = get_session()
+    def _run_search_query(
+        self,
+        country_code: str,
+        source: Source,
+        query: str,
+        limiter: _HostRateLimiter,
+    ) -> Tuple[List[DiscoveredRegulation], Optional[str]]:
+        """
+        執行單一查詢並以 LLM 解析結果（於工作執行緒中執行，不存取資料庫）
+
+        Returns:
+            (發現的法規, 錯誤訊息)，成功時錯誤訊息為 None
+        """
+        try:
+            # 同一監管機構的查詢依間隔限流，不同機構可同時進行
+            limiter.wait(urlparse(source.url).netloc)
+
+            # 執行搜尋
+            search_result = self.search_function(query, num_results=5)
+            data = json.loads(search_result) if isinstance(search_result, str) else search_result
+
+            if data.get("status") != "success":
+                return [], data.get("error", "搜尋失敗")
+
+            # 解析結果（LLM 呼叫在工作執行緒中完成）
+            discovered = list(self._iter_parse_search_results(data.get("results", ()), country_code, source, query))
+            return discovered, None
 
-        new_reg = RegulationBaseline(
+        except Exception as e:
+            return [], str(e)
+
+    def _flush_pending(
+        self,
+        session,
+        pending: List[DiscoveredRegulation],
+        results: Dict[str, Any],
+        verbose: bool,
+    ):
+        """
+        批次寫入待新增的法規；批次失敗時逐筆重試以找出問題資料
+
+        已存在的法規由資料庫唯一約束略過，計入已存在而非新增。
+        """
+        if not pending:
+            return
+
+        try:
+            outcomes = [(reg, self._insert_regulation(session, reg)) for reg in pending]
+            session.commit()
+        except Exception:
+            session.rollback()
+            outcomes = []
+            for reg in pending:
+                try:
+                    inserted = self._insert_regulation(session, reg)
+                    session.commit()
+                    outcomes.append((reg, inserted))
+                except Exception as e:
+                    session.rollback()
+                    results["errors"].append({
+                        "name": reg.name,
+                        "error": str(e),
+                    })
+                    if verbose:
+                        self._report(f"      ❌ 新增失敗: {str(e)[:30]}")
+
+        for reg, inserted in outcomes:
+            # 已寫入（或資料庫中已存在）的法規才加入名稱索引，寫入失敗者之後仍可重試
+            index = self._name_indexes.get(reg.country_code)
+            if index is not None:
+                index.add(reg.name, reg.name_en, reg.name_zh)
+
+            if inserted:
+                results["new_regulations"] += 1
+                results["added_regulations"].append({
+                    "name": reg.name,
+                    "country": reg.country_code,
+                    "url": reg.official_url,
+                })
+                if verbose:
+                    self._report(f"      ✅ 新增: {reg.name[:30]}...")
+            else:
+                results["existing_regulations"] += 1
+                results["skipped_regulations"].append({
+                    "name": reg.name,
+                    "country": reg.country_code,
+                    "reason": "已存在",
+                })
+                if verbose:
+                    self._report(f"      ⏭️ 已存在: {reg.name[:30]}...")
+
+        pending.clear()
+
+    def _insert_regulation(self, session, reg: DiscoveredRegulation) -> bool:
+        """
+        以 INSERT ... ON CONFLICT DO NOTHING 新增法規（不提交）
+
+        由 uq_regulation 約束判斷是否重複，不需先查詢。
+
+        Returns:
+            是否實際新增（False 表示已存在）
+        """
+        stmt = sqlite_insert(RegulationBaseline).values(
             name=reg.name,
             name_en=reg.name_en,
             name_zh=reg.name_zh,
@@ -605,11 +915,29 @@ class RegulationDiscoverer:
             is_active=True,
             is_mandatory=False,
             source="discovery",
-        )
+        ).on_conflict_do_nothing(
+            index_elements=["name", "country_code", "industry_code"],
+        ).returning(RegulationBaseline.id)
+
+        return session.execute(stmt).scalar() is not None
+
+    def _add_regulation(self, reg: DiscoveredRegulation, session=None) -> bool:
+        """
+        將發現的法規新增到資料庫
+
+        Returns:
+            是否實際新增（False 表示已存在）
+        """
+        with self._session_scope(session) as s:
+            inserted = self._insert_regulation(s, reg)
+            s.commit()
+
+        # 同步更新已載入的名稱索引，避免同一任務內重複新增
+        index = self._name_indexes.get(reg.country_code)
+        if index is not None:
+            index.add(reg.name, reg.name_en, reg.name_zh)
 
-        session.add(new_reg)
-        session.commit()
-        session.close()
+        return inserted
 
     def discover_from_url(
         self,
@@ -678,12 +1006,11 @@ class RegulationDiscoverer:
 如果沒有找到法規，回覆空陣列 []
 """
 
-            llm_response = self.llm_function(content[:10000], prompt)
+            llm_response = self._call_llm(_truncate_to_tokens(content, _MAX_INPUT_TOKENS), prompt)
 
             # 解析 JSON
-            json_match = re.search(r'\[.*\]', llm_response, re.DOTALL)
-            if json_match:
-                regulations = json.loads(json_match.group())
+            regulations = _extract_json(llm_response, "[")
+            if isinstance(regulations, list):
 
                 for reg_data in regulations:
                     reg = DiscoveredRegulation(
@@ -701,8 +1028,8 @@ class RegulationDiscoverer:
 
                     results["discovered"].append(reg.name)
 
-                    if not self._is_regulation_exists(reg.name, country_code):
-                        self._add_regulation(reg)
+                    # 名稱索引先行篩除近似重複，完全重複由資料庫約束略過
+                    if not self._is_regulation_exists(reg.name, country_code) and self._add_regulation(reg):
                         results["added"].append(reg.name)
                         if verbose:
                             self._report(f"  ✅ 新增: {reg.name[:40]}...")
@@ -719,6 +1046,9 @@ class RegulationDiscoverer:
 
     def close(self):
         """關閉資源"""
+        if self._azure_client is not None:
+            self._azure_client.close()
+            self._azure_client = None
         self.manager.close()
 
 
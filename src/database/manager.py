@@ -8,12 +8,18 @@
 - 查詢功能
 """
 
+import re
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from typing import Callable, Optional
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, and_, bindparam, case, func, or_, select, text, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, undefer_group
+from sqlalchemy.orm.util import identity_key
 
+from ..utils.logging import get_logger
 from .models import (
     Country,
     Industry,
@@ -23,12 +29,150 @@ from .models import (
     get_session,
 )
 
+logger = get_logger(__name__)
+
+# 法規查詢的篩選條件，值於執行時以 bindparam 傳入
+_REGULATION_FILTERS = {
+    "country_code": RegulationBaseline.country_code == bindparam("country_code"),
+    "industry_code": RegulationBaseline.industry_code == bindparam("industry_code"),
+    "topic_code": RegulationBaseline.topic_code == bindparam("topic_code"),
+    "is_mandatory": RegulationBaseline.is_mandatory == bindparam("is_mandatory"),
+    "min_confidence": RegulationBaseline.confidence_score >= bindparam("min_confidence"),
+    "is_verified": RegulationBaseline.is_verified == bindparam("is_verified"),
+}
+
+# 官方網站網域（.gov / .go. / .gob），與 _confidence_expression 的判斷一致
+_GOV_URL_MARKERS = (".gov", ".go.", ".gob")
+_GOV_URL_RE = re.compile("|".join(re.escape(marker) for marker in _GOV_URL_MARKERS))
+
+# 批次檢查既有法規時每次查詢的筆數（每筆 3 個參數）
+_EXISTING_KEYS_CHUNK = 500
+
+# 批次 upsert 時以新資料覆寫的欄位
+_UPSERT_COLUMNS = ("name_en", "search_keywords")
+
+# 批次新增的 INSERT 語句（只建立一次，編譯結果由引擎的語句快取重複使用）；
+# 直接對資料表執行 Core INSERT，不經過 ORM 的批次寫入流程
+_UNIQUE_KEY = ["name", "country_code", "industry_code"]
+_regulations = RegulationBaseline.__table__
+_insert = sqlite_insert(_regulations)
+# 衝突時略過，避免查詢後其他連線已寫入相同法規
+_BULK_INSERT = _insert.on_conflict_do_nothing(index_elements=_UNIQUE_KEY).returning(_regulations.c.id)
+# 衝突時只更新內容有變動的列，重複執行不會改動任何資料（updated_at 取新增時的預設值）
+_BULK_UPSERT = _insert.on_conflict_do_update(
+    index_elements=_UNIQUE_KEY,
+    set_={column: _insert.excluded[column] for column in (*_UPSERT_COLUMNS, "updated_at")},
+    where=or_(*(
+        _regulations.c[column].is_distinct_from(_insert.excluded[column])
+        for column in _UPSERT_COLUMNS
+    )),
+).returning(_regulations.c.id)
+del _regulations, _insert
+
+# 匯出時只需要的欄位（不建立 ORM 物件）
+_EXPORT_COLUMNS = (
+    RegulationBaseline.id,
+    RegulationBaseline.name,
+    RegulationBaseline.name_en,
+    RegulationBaseline.name_zh,
+    RegulationBaseline.country_code,
+    RegulationBaseline.industry_code,
+    RegulationBaseline.topic_code,
+    RegulationBaseline.regulation_type,
+    RegulationBaseline.issuing_authority,
+    RegulationBaseline.official_url,
+    RegulationBaseline.search_keywords,
+    RegulationBaseline.confidence_score,
+    RegulationBaseline.is_verified,
+    RegulationBaseline.is_mandatory,
+    RegulationBaseline.last_verified_at,
+    RegulationBaseline.last_found_at,
+)
+
+# 匯出時每批讀取的筆數
+_EXPORT_BATCH_SIZE = 500
+
+# 依篩選條件組合（與是否為匯出欄位）快取已建構的查詢
+_REGULATION_QUERIES: dict[tuple[tuple[str, ...], bool], Select] = {}
+
+
+def _regulation_query(filters: tuple[str, ...], export: bool = False) -> Select:
+    """取得（必要時建構）指定篩選條件組合的法規查詢"""
+    stmt = _REGULATION_QUERIES.get((filters, export))
+    if stmt is None:
+        # 回傳的 ORM 物件常在 Session 關閉後使用，需一併載入 JSON 欄位
+        stmt = select(*_EXPORT_COLUMNS) if export else select(RegulationBaseline).options(undefer_group("json"))
+        stmt = stmt.where(
+            RegulationBaseline.is_active == True,
+            *(_REGULATION_FILTERS[name] for name in filters),
+        ).order_by(
+            RegulationBaseline.is_mandatory.desc(),
+            RegulationBaseline.confidence_score.desc(),
+        )
+        _REGULATION_QUERIES[(filters, export)] = stmt
+    return stmt
+
+
+# 必搜法規的搜尋關鍵字：以 json_each 在 SQL 中展開，只取需要的欄位
+# 排序與依法規排序後逐一展開、再依優先級穩定排序的結果相同
+_SEARCH_KEYWORDS_SQL = text("""
+    SELECT
+        kw.value AS keyword,
+        r.name AS regulation_name,
+        r.id AS regulation_id,
+        COALESCE(NULLIF(r.search_priority, 0), 1) AS priority
+    FROM regulation_baselines AS r, json_each(r.search_keywords) AS kw
+    WHERE r.is_active = 1
+      AND r.is_mandatory = 1
+      AND json_type(r.search_keywords) = 'array'
+      AND (:country_code IS NULL OR r.country_code = :country_code)
+      AND (:industry_code IS NULL OR r.industry_code = :industry_code)
+      AND (:topic_code IS NULL OR r.topic_code = :topic_code)
+    ORDER BY priority, r.is_mandatory DESC, r.confidence_score DESC, r.id, kw.key
+""")
+
+
+def _confidence_expression(now: datetime):
+    """calculate_confidence 的 SQL 版本（各項依相同順序加總，結果與 Python 版一致）"""
+    reg = RegulationBaseline
+    days_since_found = func.julianday(now) - func.julianday(reg.last_found_at)
+    official_url = func.coalesce(reg.official_url, "")
+    is_gov_url = or_(*(func.instr(official_url, gov) > 0 for gov in _GOV_URL_MARKERS))
+
+    score = (
+        0.0
+        + case((reg.is_verified == True, 0.3), else_=0.0)
+        + case((is_gov_url, 0.3), (official_url != "", 0.1), else_=0.0)
+        + case((days_since_found < 31, 0.2), (days_since_found < 91, 0.1), else_=0.0)
+        + case((func.coalesce(reg.found_count, 0) >= 3, 0.2), else_=0.0)
+        - case((days_since_found >= 91, 0.3), else_=0.0)
+        - case((func.coalesce(reg.not_found_count, 0) >= 3, 0.2), else_=0.0)
+    )
+    # 確保在 0-1 範圍
+    return func.max(0.0, func.min(1.0, score))
+
+
+def _regulation_params(**filters) -> dict:
+    """去除未指定（None）的篩選條件"""
+    return {key: value for key, value in filters.items() if value is not None}
+
 
 class BaselineManager:
     """法規 Baseline 管理器"""
 
-    def __init__(self, session: Optional[Session] = None):
-        self.session = session or get_session()
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
+        """
+        初始化管理器
+
+        Args:
+            session: 既有的 Session（由呼叫端負責生命週期）
+            session_factory: 建立 Session 的工廠（預設使用共用的連線池）
+        """
+        self.session = session or (session_factory or get_session)()
 
     def close(self):
         """關閉 session"""
@@ -40,61 +184,84 @@ class BaselineManager:
 
     def get_all_countries(self) -> list[dict]:
         """取得所有國家"""
-        countries = self.session.query(Country).filter_by(is_active=True).all()
-        return [
-            {
-                "code": c.code,
-                "name_zh": c.name_zh,
-                "name_en": c.name_en,
-                "region": c.region,
-            }
-            for c in countries
-        ]
+        rows = self.session.execute(
+            select(Country.code, Country.name_zh, Country.name_en, Country.region)
+            .where(Country.is_active == True)
+        ).mappings()
+        return [dict(row) for row in rows]
 
     def get_all_industries(self) -> list[dict]:
         """取得所有產業"""
-        industries = self.session.query(Industry).filter_by(is_active=True).all()
-        return [
-            {
-                "code": i.code,
-                "name_zh": i.name_zh,
-                "name_en": i.name_en,
-                "category": i.category,
-            }
-            for i in industries
-        ]
+        rows = self.session.execute(
+            select(Industry.code, Industry.name_zh, Industry.name_en, Industry.category)
+            .where(Industry.is_active == True)
+        ).mappings()
+        return [dict(row) for row in rows]
 
     def get_all_topics(self) -> list[dict]:
         """取得所有主題"""
-        topics = self.session.query(Topic).filter_by(is_active=True).all()
+        rows = self.session.execute(
+            select(Topic.code, Topic.name_zh, Topic.name_en)
+            .where(Topic.is_active == True)
+        ).mappings()
+        return [dict(row) for row in rows]
+
+    @cached_property
+    def _countries_by_key(self) -> dict[str, Country]:
+        """國家參照快取：中文名稱、英文名稱、代碼皆可查詢"""
+        lookup: dict[str, Country] = {}
+        # 反向加入，使多筆相符時保留資料表中較前面的一筆
+        for country in reversed(self.session.scalars(select(Country).order_by(Country.id)).all()):
+            for key in (country.name_zh, country.name_en, country.code):
+                if key:
+                    lookup[key] = country
+        return lookup
+
+    @cached_property
+    def _industries(self) -> list[tuple[str, str, Industry]]:
+        """產業參照快取：(小寫中文名稱, 小寫英文名稱, 產業)"""
+        industries = self.session.scalars(select(Industry).order_by(Industry.id)).all()
         return [
-            {
-                "code": t.code,
-                "name_zh": t.name_zh,
-                "name_en": t.name_en,
-            }
-            for t in topics
+            ((i.name_zh or "").lower(), (i.name_en or "").lower(), i)
+            for i in industries
         ]
 
+    @cached_property
+    def _industries_by_name(self) -> dict[str, Optional[Industry]]:
+        """產業名稱查詢結果快取（含查無結果）"""
+        return {}
+
+    def refresh_reference_cache(self):
+        """清除國家/產業參照快取（參照資料異動後呼叫）"""
+        for attr in ("_countries_by_key", "_industries", "_industries_by_name"):
+            self.__dict__.pop(attr, None)
+
     def get_country_by_name(self, name: str) -> Optional[Country]:
         """根據名稱取得國家（支援中英文）"""
-        return self.session.query(Country).filter(
-            or_(
-                Country.name_zh == name,
-                Country.name_en == name,
-                Country.code == name.upper(),
-            )
-        ).first()
+        countries = self._countries_by_key
+        country = countries.get(name) or countries.get(name.upper())
+        if country is None:
+            # 快取建立後才新增的國家：以具唯一索引的代碼查詢
+            country = self.session.scalars(select(Country).where(Country.code == name.upper())).first()
+            if country is not None:
+                countries[country.code] = country
+        return country
 
     def get_industry_by_name(self, name: str) -> Optional[Industry]:
-        """根據名稱取得產業（支援中英文）"""
-        return self.session.query(Industry).filter(
-            or_(
-                Industry.name_zh.contains(name),
-                Industry.name_en.ilike(f"%{name}%"),
-                Industry.code == name,
-            )
-        ).first()
+        """根據名稱取得產業（支援中英文，部分比對不分大小寫）"""
+        lookups = self._industries_by_name
+        if name in lookups:
+            return lookups[name]
+
+        # 產業數量很少，直接在記憶體中依資料表順序比對
+        needle = name.lower()
+        match = None
+        for name_zh, name_en, industry in self._industries:
+            if needle in name_zh or needle in name_en or industry.code == name:
+                match = industry
+                break
+        lookups[name] = match
+        return match
 
     # ============================================================
     # 法規 Baseline CRUD
@@ -127,10 +294,10 @@ class BaselineManager:
         ).first()
 
         if existing:
-            print(f"[Manager] 法規已存在: {name}")
+            logger.debug("法規已存在: {}", name)
             return existing
 
-        regulation = RegulationBaseline(
+        regulation = RegulationBaseline(**self._regulation_row(
             name=name,
             name_en=name_en,
             name_zh=name_zh,
@@ -140,21 +307,125 @@ class BaselineManager:
             regulation_type=regulation_type,
             issuing_authority=issuing_authority,
             official_url=official_url,
-            search_keywords=search_keywords or [name],
+            search_keywords=search_keywords,
             is_mandatory=is_mandatory,
             source=source,
-            confidence_score=0.5 if source == "manual" else 0.3,
-            is_verified=source == "manual",
-        )
+        ))
 
         self.session.add(regulation)
         self.session.commit()
-        print(f"[Manager] 已新增法規: {name}")
+        logger.debug("已新增法規: {}", name)
         return regulation
 
+    def add_regulations_bulk(
+        self,
+        regulations: list[dict],
+        upsert: bool = False,
+        commit: bool = True,
+        check_existing: bool = True,
+    ) -> int:
+        """
+        批次新增法規（一次查詢既有法規、單一 INSERT 語句、單次提交）
+
+        每筆資料的欄位與 add_regulation 的參數相同，已存在的法規（名稱、國家、產業相同）會略過。
+
+        Args:
+            regulations: 法規資料列表
+            upsert: 是否以資料更新既有法規的 _UPSERT_COLUMNS 欄位（不另外查詢既有法規）
+            commit: 是否立即提交；呼叫端自行管理交易時設為 False
+            check_existing: 是否先查詢既有法規；設為 False 時直接寫入，由唯一鍵衝突略過既有法規
+
+        Returns:
+            實際新增的筆數（upsert 時為新增或內容有變動的筆數）
+        """
+        if not regulations:
+            return 0
+
+        if upsert:
+            # 同一批中重複的法規只保留最後一筆，避免同一語句更新同一列兩次
+            rows = list({
+                (reg["name"], reg["country_code"], reg["industry_code"]): self._regulation_row(**reg)
+                for reg in regulations
+            }.values())
+        else:
+            # 先以 IN 查詢找出已存在的法規，只送出需要新增的資料
+            existing = self._existing_regulation_keys(
+                [(reg["name"], reg["country_code"], reg["industry_code"]) for reg in regulations]
+            ) if check_existing else set()
+            rows = []
+            for reg in regulations:
+                key = (reg["name"], reg["country_code"], reg["industry_code"])
+                if key not in existing:
+                    existing.add(key)
+                    rows.append(self._regulation_row(**reg))
+
+        inserted = 0
+        if rows:
+            stmt = _BULK_UPSERT if upsert else _BULK_INSERT
+            inserted = len(self.session.execute(stmt, rows).all())
+            if commit:
+                self.session.commit()
+
+        logger.debug("已批次新增 {} 筆法規，共 {} 筆", inserted, len(regulations))
+        return inserted
+
+    def _existing_regulation_keys(self, keys: list[tuple[str, str, str]]) -> set[tuple[str, str, str]]:
+        """查詢已存在的 (名稱, 國家代碼, 產業代碼)，分段查詢以避免超過 SQLite 參數上限"""
+        key_columns = tuple_(
+            RegulationBaseline.name,
+            RegulationBaseline.country_code,
+            RegulationBaseline.industry_code,
+        )
+        existing: set[tuple[str, str, str]] = set()
+        for start in range(0, len(keys), _EXISTING_KEYS_CHUNK):
+            chunk = keys[start:start + _EXISTING_KEYS_CHUNK]
+            existing.update(
+                tuple(row) for row in self.session.execute(
+                    select(
+                        RegulationBaseline.name,
+                        RegulationBaseline.country_code,
+                        RegulationBaseline.industry_code,
+                    ).where(key_columns.in_(chunk))
+                )
+            )
+        return existing
+
+    @staticmethod
+    def _regulation_row(
+        name: str,
+        country_code: str,
+        industry_code: str,
+        topic_code: str,
+        name_en: str = None,
+        name_zh: str = None,
+        regulation_type: str = None,
+        issuing_authority: str = None,
+        official_url: str = None,
+        search_keywords: list[str] = None,
+        is_mandatory: bool = False,
+        source: str = "manual",
+    ) -> dict:
+        """組成新增法規的欄位資料（套用預設關鍵字與信心度）"""
+        return {
+            "name": name,
+            "name_en": name_en,
+            "name_zh": name_zh,
+            "country_code": country_code,
+            "industry_code": industry_code,
+            "topic_code": topic_code,
+            "regulation_type": regulation_type,
+            "issuing_authority": issuing_authority,
+            "official_url": official_url,
+            "search_keywords": search_keywords or [name],
+            "is_mandatory": is_mandatory,
+            "source": source,
+            "confidence_score": 0.5 if source == "manual" else 0.3,
+            "is_verified": source == "manual",
+        }
+
     def update_regulation(self, regulation_id: int, **kwargs) -> Optional[RegulationBaseline]:
         """更新法規"""
-        regulation = self.session.query(RegulationBaseline).get(regulation_id)
+        regulation = self.session.get(RegulationBaseline, regulation_id)
         if not regulation:
             return None
 
@@ -168,7 +439,7 @@ class BaselineManager:
 
     def delete_regulation(self, regulation_id: int) -> bool:
         """刪除法規（軟刪除）"""
-        regulation = self.session.query(RegulationBaseline).get(regulation_id)
+        regulation = self.session.get(RegulationBaseline, regulation_id)
         if not regulation:
             return False
 
@@ -179,7 +450,7 @@ class BaselineManager:
 
     def get_regulation(self, regulation_id: int) -> Optional[RegulationBaseline]:
         """取得單一法規"""
-        return self.session.query(RegulationBaseline).get(regulation_id)
+        return self.session.get(RegulationBaseline, regulation_id, options=[undefer_group("json")])
 
     # ============================================================
     # 查詢功能
@@ -195,28 +466,15 @@ class BaselineManager:
         is_verified: bool = None,
     ) -> list[RegulationBaseline]:
         """根據條件查詢法規"""
-
-        query = self.session.query(RegulationBaseline).filter(
-            RegulationBaseline.is_active == True
+        params = _regulation_params(
+            country_code=country_code or None,
+            industry_code=industry_code or None,
+            topic_code=topic_code or None,
+            is_mandatory=is_mandatory,
+            min_confidence=min_confidence,
+            is_verified=is_verified,
         )
-
-        if country_code:
-            query = query.filter(RegulationBaseline.country_code == country_code)
-        if industry_code:
-            query = query.filter(RegulationBaseline.industry_code == industry_code)
-        if topic_code:
-            query = query.filter(RegulationBaseline.topic_code == topic_code)
-        if is_mandatory is not None:
-            query = query.filter(RegulationBaseline.is_mandatory == is_mandatory)
-        if min_confidence is not None:
-            query = query.filter(RegulationBaseline.confidence_score >= min_confidence)
-        if is_verified is not None:
-            query = query.filter(RegulationBaseline.is_verified == is_verified)
-
-        return query.order_by(
-            RegulationBaseline.is_mandatory.desc(),
-            RegulationBaseline.confidence_score.desc(),
-        ).all()
+        return list(self.session.scalars(_regulation_query(tuple(params)), params))
 
     def get_mandatory_regulations(
         self,
@@ -239,33 +497,21 @@ class BaselineManager:
         topic_code: str = None,
     ) -> list[dict]:
         """取得搜尋關鍵字清單（供 Researcher Agent 使用）"""
+        rows = self.session.execute(_SEARCH_KEYWORDS_SQL, {
+            "country_code": country_code or None,
+            "industry_code": industry_code or None,
+            "topic_code": topic_code or None,
+        }).mappings()
 
-        regulations = self.get_mandatory_regulations(
-            country_code=country_code,
-            industry_code=industry_code,
-            topic_code=topic_code,
-        )
-
-        keywords = []
-        for reg in regulations:
-            if reg.search_keywords:
-                for kw in reg.search_keywords:
-                    keywords.append({
-                        "keyword": kw,
-                        "regulation_name": reg.name,
-                        "regulation_id": reg.id,
-                        "priority": reg.search_priority or 1,
-                    })
-
-        return sorted(keywords, key=lambda x: x["priority"])
+        return [dict(row) for row in rows]
 
     # ============================================================
     # 信心度計算
     # ============================================================
 
-    def calculate_confidence(self, regulation: RegulationBaseline) -> float:
+    def calculate_confidence(self, regulation: RegulationBaseline, now: datetime = None) -> float:
         """
-        計算法規信心度
+        計算法規信心度（只讀取物件屬性，不查詢資料庫）
 
         信心度因子:
         - 人工驗證過: +0.3
@@ -277,22 +523,27 @@ class BaselineManager:
         - 超過 90 天未搜尋到: -0.3
         - URL 失效: -0.2
         - 標記為草案/已廢止: -0.5
+
+        Args:
+            regulation: 法規物件
+            now: 計算基準時間（預設為目前 UTC 時間）
         """
 
         score = 0.0
+        last_found_at = regulation.last_found_at
+        days_since_found = ((now or datetime.utcnow()) - last_found_at).days if last_found_at else None
 
         # 正向因子
         if regulation.is_verified:
             score += 0.3
 
         if regulation.official_url:
-            if any(gov in regulation.official_url for gov in [".gov", ".go.", ".gob"]):
+            if _GOV_URL_RE.search(regulation.official_url):
                 score += 0.3  # 官方 URL
             else:
                 score += 0.1
 
-        if regulation.last_found_at:
-            days_since_found = (datetime.utcnow() - regulation.last_found_at).days
+        if days_since_found is not None:
             if days_since_found <= 30:
                 score += 0.2
             elif days_since_found <= 90:
@@ -302,10 +553,8 @@ class BaselineManager:
             score += 0.2
 
         # 負向因子
-        if regulation.last_found_at:
-            days_since_found = (datetime.utcnow() - regulation.last_found_at).days
-            if days_since_found > 90:
-                score -= 0.3
+        if days_since_found is not None and days_since_found > 90:
+            score -= 0.3
 
         if regulation.not_found_count and regulation.not_found_count >= 3:
             score -= 0.2
@@ -314,18 +563,41 @@ class BaselineManager:
         return max(0.0, min(1.0, score))
 
     def update_confidence(self, regulation_id: int) -> float:
-        """更新法規信心度"""
-        regulation = self.session.query(RegulationBaseline).get(regulation_id)
+        """更新法規信心度（物件已在 Session 中時不再查詢）"""
+        regulation = self.session.get(RegulationBaseline, regulation_id)
         if not regulation:
             return 0.0
 
-        new_confidence = self.calculate_confidence(regulation)
+        now = datetime.utcnow()
+        new_confidence = self.calculate_confidence(regulation, now)
         regulation.confidence_score = new_confidence
-        regulation.updated_at = datetime.utcnow()
+        regulation.updated_at = now
         self.session.commit()
 
         return new_confidence
 
+    def recompute_all_confidences(self) -> int:
+        """
+        以單一 UPDATE 重新計算所有法規的信心度
+
+        計分規則與 calculate_confidence 相同，直接在 SQLite 中計算，不需載入 ORM 物件。
+
+        Returns:
+            信心度有變動的法規筆數
+        """
+        now = datetime.utcnow()
+        new_confidence = _confidence_expression(now)
+        result = self.session.execute(
+            update(RegulationBaseline)
+            .where(RegulationBaseline.confidence_score.is_distinct_from(new_confidence))
+            .values(confidence_score=new_confidence, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        self.session.commit()
+        # 已載入的物件需重新讀取才會反映新的信心度
+        self.session.expire_all()
+        return result.rowcount
+
     # ============================================================
     # 驗證記錄
     # ============================================================
@@ -341,26 +613,43 @@ class BaselineManager:
         notes: str = None,
         verified_by: str = "system",
     ) -> VerificationLog:
-        """記錄驗證結果"""
-
-        regulation = self.session.query(RegulationBaseline).get(regulation_id)
-        if not regulation:
-            raise ValueError(f"找不到法規 ID: {regulation_id}")
+        """
+        記錄驗證結果並同步更新信心度
 
-        old_confidence = regulation.confidence_score
+        計數以原子性的 UPDATE 遞增（不需先讀取法規），信心度以 SQL 重新計算，
+        連同驗證記錄在同一個交易中寫入並只提交一次，呼叫端不需要再呼叫 update_confidence。
+        """
+        now = datetime.utcnow()
+        reg = RegulationBaseline
+        counters = (
+            {"found_count": func.coalesce(reg.found_count, 0) + 1, "last_found_at": now}
+            if was_found
+            else {"not_found_count": func.coalesce(reg.not_found_count, 0) + 1}
+        )
 
-        # 更新法規記錄
-        if was_found:
-            regulation.last_found_at = datetime.utcnow()
-            regulation.found_count = (regulation.found_count or 0) + 1
+        # 更新計數（RETURNING 取得尚未變動的信心度）
+        old_confidence = self.session.execute(
+            update(reg)
+            .where(reg.id == regulation_id)
+            .values(last_verified_at=now, **counters)
+            .returning(reg.confidence_score)
+            .execution_options(synchronize_session="fetch")
+        ).scalar()
+        if old_confidence is None:
+            if not self.session.get(reg, regulation_id):
+                raise ValueError(f"找不到法規 ID: {regulation_id}")
         else:
-            regulation.not_found_count = (regulation.not_found_count or 0) + 1
-
-        regulation.last_verified_at = datetime.utcnow()
-
-        # 重新計算信心度
-        new_confidence = self.calculate_confidence(regulation)
-        regulation.confidence_score = new_confidence
+            old_confidence = float(old_confidence)
+
+        # 依更新後的計數重新計算信心度
+        new_confidence = self.session.execute(
+            update(reg)
+            .where(reg.id == regulation_id)
+            .values(confidence_score=_confidence_expression(now))
+            .returning(reg.confidence_score)
+            .execution_options(synchronize_session="fetch")
+        ).scalar_one()
+        new_confidence = float(new_confidence)
 
         # 建立驗證記錄
         log = VerificationLog(
@@ -379,6 +668,11 @@ class BaselineManager:
         self.session.add(log)
         self.session.commit()
 
+        # 已載入的法規物件需重新讀取才會反映更新後的計數、時間與信心度
+        regulation = self.session.identity_map.get(identity_key(reg, regulation_id))
+        if regulation is not None:
+            self.session.expire(regulation)
+
         return log
 
     def get_verification_history(
@@ -399,40 +693,47 @@ class BaselineManager:
     # 統計功能
     # ============================================================
 
-    def get_statistics(self) -> dict:
-        """取得統計資訊"""
-        total = self.session.query(RegulationBaseline).filter_by(is_active=True).count()
-        verified = self.session.query(RegulationBaseline).filter_by(
-            is_active=True, is_verified=True
-        ).count()
-        mandatory = self.session.query(RegulationBaseline).filter_by(
-            is_active=True, is_mandatory=True
-        ).count()
+    def get_statistics(self, include_industries: bool = True) -> dict:
+        """
+        取得統計資訊
+
+        Args:
+            include_industries: 是否一併統計各產業筆數（不需要時可省去一次 GROUP BY 查詢）
+
+        Returns:
+            總數、已驗證、必搜筆數與按國家（及產業）的統計
+        """
+        # 總數、已驗證、必搜一次查詢取得
+        total, verified, mandatory = self.session.execute(
+            select(
+                func.count(),
+                func.sum(case((RegulationBaseline.is_verified == True, 1), else_=0)),
+                func.sum(case((RegulationBaseline.is_mandatory == True, 1), else_=0)),
+            ).where(RegulationBaseline.is_active == True)
+        ).one()
 
         # 按國家統計
-        by_country = {}
-        countries = self.session.query(Country).filter_by(is_active=True).all()
-        for country in countries:
-            count = self.session.query(RegulationBaseline).filter_by(
-                is_active=True, country_code=country.code
-            ).count()
-            if count > 0:
-                by_country[country.name_zh] = count
+        by_country = dict(self.session.execute(
+            select(Country.name_zh, func.count(RegulationBaseline.id))
+            .join(RegulationBaseline, RegulationBaseline.country_code == Country.code)
+            .where(Country.is_active == True, RegulationBaseline.is_active == True)
+            .group_by(Country.id)
+            .order_by(Country.id)
+        ).all())
 
         # 按產業統計
-        by_industry = {}
-        industries = self.session.query(Industry).filter_by(is_active=True).all()
-        for industry in industries:
-            count = self.session.query(RegulationBaseline).filter_by(
-                is_active=True, industry_code=industry.code
-            ).count()
-            if count > 0:
-                by_industry[industry.name_zh] = count
+        by_industry = {} if not include_industries else dict(self.session.execute(
+            select(Industry.name_zh, func.count(RegulationBaseline.id))
+            .join(RegulationBaseline, RegulationBaseline.industry_code == Industry.code)
+            .where(Industry.is_active == True, RegulationBaseline.is_active == True)
+            .group_by(Industry.id)
+            .order_by(Industry.id)
+        ).all())
 
         return {
             "total": total,
-            "verified": verified,
-            "mandatory": mandatory,
+            "verified": verified or 0,
+            "mandatory": mandatory or 0,
             "by_country": by_country,
             "by_industry": by_industry,
         }
@@ -443,29 +744,28 @@ class BaselineManager:
         industry_code: str = None,
     ) -> list[dict]:
         """匯出法規為字典格式"""
-        regulations = self.get_regulations_by_query(
-            country_code=country_code,
-            industry_code=industry_code,
-        )
+        return list(self.iter_export_dicts(country_code=country_code, industry_code=industry_code))
 
-        return [
-            {
-                "id": r.id,
-                "name": r.name,
-                "name_en": r.name_en,
-                "name_zh": r.name_zh,
-                "country_code": r.country_code,
-                "industry_code": r.industry_code,
-                "topic_code": r.topic_code,
-                "regulation_type": r.regulation_type,
-                "issuing_authority": r.issuing_authority,
-                "official_url": r.official_url,
-                "search_keywords": r.search_keywords,
-                "confidence_score": r.confidence_score,
-                "is_verified": r.is_verified,
-                "is_mandatory": r.is_mandatory,
-                "last_verified_at": r.last_verified_at.isoformat() if r.last_verified_at else None,
-                "last_found_at": r.last_found_at.isoformat() if r.last_found_at else None,
-            }
-            for r in regulations
-        ]
+    def iter_export_dicts(
+        self,
+        country_code: str = None,
+        industry_code: str = None,
+    ) -> Iterator[dict]:
+        """
+        逐筆產生匯出的法規字典
+
+        以串流方式逐批（每批 500 筆）讀取，大量匯出時不需一次保留所有資料。
+        """
+        params = _regulation_params(
+            country_code=country_code or None,
+            industry_code=industry_code or None,
+        )
+        stmt = _regulation_query(tuple(params), export=True).execution_options(yield_per=_EXPORT_BATCH_SIZE)
+        rows = self.session.execute(stmt, params).mappings()
+
+        for row in rows:
+            item = dict(row)
+            for key in ("last_verified_at", "last_found_at"):
+                if item[key]:
+                    item[key] = item[key].isoformat()
+            yield item
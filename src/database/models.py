@@ -4,11 +4,12 @@
 使用 SQLite + SQLAlchemy 管理法規基準清單
 """
 
+import json
+import threading
 from datetime import datetime
 from pathlib import Path
 
 from sqlalchemy import (
-    JSON,
     Boolean,
     Column,
     DateTime,
@@ -17,15 +18,64 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    TypeDecorator,
     UniqueConstraint,
     create_engine,
+    event,
+    text,
+    update,
 )
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import deferred, sessionmaker
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 依安裝環境而定
+    orjson = None
 
 Base = declarative_base()
 
 
+class RawJSON(str):
+    """已序列化的 JSON 文字，寫入 FastJSON 欄位時不再重新序列化"""
+
+    __slots__ = ()
+
+
+def encode_json(value) -> RawJSON:
+    """預先序列化 JSON 值（與 FastJSON 寫入的格式相同），供重複寫入的資料只序列化一次"""
+    if orjson is not None:
+        return RawJSON(orjson.dumps(value).decode())
+    return RawJSON(json.dumps(value, ensure_ascii=False, separators=(",", ":")))
+
+
+class FastJSON(TypeDecorator):
+    """
+    以 TEXT 儲存的 JSON 欄位
+
+    已安裝 orjson 時以其序列化/解析（C 擴充），否則退回標準函式庫 json。
+    兩者都以 UTF-8 原文儲存，SQLite 的 json_each 等函數可直接使用。
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, RawJSON):
+            return str(value)
+        return encode_json(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if orjson is not None:
+            return orjson.loads(value)
+        return json.loads(value)
+
+
 class Country(Base):
     """國家/地區表"""
     __tablename__ = "countries"
@@ -35,7 +85,7 @@ class Country(Base):
     name_zh = Column(String(50), nullable=False)  # 中文名稱
     name_en = Column(String(50), nullable=False)  # 英文名稱
     region = Column(String(50))  # 區域: 東亞、東南亞、歐洲...
-    search_config = Column(JSON)  # Google Custom Search 設定
+    search_config = Column(FastJSON)  # Google Custom Search 設定
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -51,7 +101,7 @@ class Industry(Base):
     name_en = Column(String(100), nullable=False)  # 英文名稱
     category = Column(String(50))  # 大類: 金融、科技、製造...
     description = Column(Text)  # 描述
-    keywords = Column(JSON)  # 相關搜尋關鍵字
+    keywords = Column(FastJSON)  # 相關搜尋關鍵字
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -66,7 +116,7 @@ class Topic(Base):
     name_zh = Column(String(100), nullable=False)
     name_en = Column(String(100), nullable=False)
     description = Column(Text)
-    keywords = Column(JSON)  # 各語言的搜尋關鍵字
+    keywords = Column(FastJSON)  # 各語言的搜尋關鍵字
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -89,7 +139,7 @@ class RegulationBaseline(Base):
     topic_code = Column(String(50), nullable=False)  # 主題代碼
 
     # === 產業適用性 ===
-    applicable_industries = Column(JSON)  # 適用產業列表，如 ["banking", "insurance", "fintech"]
+    applicable_industries = deferred(Column(FastJSON), group="json")  # 適用產業列表，如 ["banking", "insurance"]
     is_cross_industry = Column(Boolean, default=False)  # 是否為跨產業通用法規（如個資法、資安法）
 
     # === 法規資訊 ===
@@ -100,7 +150,7 @@ class RegulationBaseline(Base):
     last_amended = Column(String(20))  # 最後修訂日期
 
     # === 搜尋設定 ===
-    search_keywords = Column(JSON)  # 搜尋關鍵字列表
+    search_keywords = deferred(Column(FastJSON), group="json")  # 搜尋關鍵字列表
     search_priority = Column(Integer, default=1)  # 搜尋優先級 (1=最高)
 
     # === 信心度與驗證 ===
@@ -112,8 +162,8 @@ class RegulationBaseline(Base):
     # === 驗證記錄 ===
     last_verified_at = Column(DateTime)  # 上次驗證時間
     last_found_at = Column(DateTime)  # 上次搜尋到的時間
-    found_count = Column(Integer, default=0)  # 被搜尋到的次數
-    not_found_count = Column(Integer, default=0)  # 未搜尋到的次數
+    found_count = Column(Integer, default=0, nullable=False, server_default="0")  # 被搜尋到的次數
+    not_found_count = Column(Integer, default=0, nullable=False, server_default="0")  # 未搜尋到的次數
     verification_notes = Column(Text)  # 驗證備註
 
     # === 元資料 ===
@@ -121,11 +171,22 @@ class RegulationBaseline(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # JSON 欄位（applicable_industries、search_keywords）屬於延遲載入群組 "json"，
+    # 需要時以 undefer_group("json") 一併載入，避免不需要的查詢解析 JSON
+
     # === 索引 ===
     __table_args__ = (
         Index('idx_country_industry_topic', 'country_code', 'industry_code', 'topic_code'),
         Index('idx_confidence', 'confidence_score'),
         Index('idx_is_mandatory', 'is_mandatory'),
+        Index('idx_country_active', 'country_code', 'is_active'),
+        # 有效法規的常用篩選與排序 (is_mandatory DESC, confidence_score DESC)
+        Index(
+            'idx_active_mand_conf',
+            'country_code', 'industry_code', 'is_mandatory', 'confidence_score',
+            sqlite_where=text('is_active = 1'),
+        ),
+        Index('idx_reg_active', 'is_active'),
         UniqueConstraint('name', 'country_code', 'industry_code', name='uq_regulation'),
     )
 
@@ -160,22 +221,86 @@ def get_database_path() -> Path:
     return db_dir / "regulation_baseline.db"
 
 
+# 依資料庫 URL 快取的引擎與 Session 工廠（整個行程共用連線池）
+_ENGINES: dict[str, Engine] = {}
+_SESSION_FACTORIES: dict[str, sessionmaker] = {}
+_ENGINE_LOCK = threading.Lock()
+
+# 每個 SQLite 連線建立時套用的設定
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",  # 讀寫不互相阻塞，且免去回滾日誌的重複寫入
+    "PRAGMA synchronous=NORMAL",  # WAL 模式下僅於檢查點時 fsync
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB 記憶體映射
+    "PRAGMA cache_size=-20000",  # 約 20 MB 頁面快取
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """連線建立時設定 SQLite PRAGMA"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 def get_engine():
-    """取得資料庫引擎"""
-    db_path = get_database_path()
-    return create_engine(f"sqlite:///{db_path}", echo=False)
+    """取得資料庫引擎（同一資料庫只建立一次）"""
+    url = f"sqlite:///{get_database_path()}"
+    engine = _ENGINES.get(url)
+    if engine is None:
+        with _ENGINE_LOCK:
+            engine = _ENGINES.get(url)
+            if engine is None:
+                engine = create_engine(
+                    url,
+                    echo=False,
+                    insertmanyvalues_page_size=1000,
+                    query_cache_size=1200,
+                    # 連線由連線池在執行緒間重複使用
+                    connect_args={"check_same_thread": False},
+                )
+                event.listen(engine, "connect", _apply_sqlite_pragmas)
+                _ENGINES[url] = engine
+    return engine
+
+
+def get_session_factory() -> sessionmaker:
+    """取得共用的 Session 工廠"""
+    engine = get_engine()
+    url = str(engine.url)
+    factory = _SESSION_FACTORIES.get(url)
+    if factory is None:
+        # 提交後不讓物件過期，避免讀取屬性時逐筆重新查詢；需要最新資料時請明確呼叫 session.refresh()
+        # 關閉 autoflush：寫入路徑都是新增後直接提交，查詢前不需要先送出待寫入的物件
+        factory = sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+        _SESSION_FACTORIES[url] = factory
+    return factory
 
 
 def get_session():
     """取得資料庫 Session"""
-    engine = get_engine()
-    Session = sessionmaker(bind=engine)
-    return Session()
+    return get_session_factory()()
 
 
 def init_database():
     """初始化資料庫（建立所有表）"""
     engine = get_engine()
     Base.metadata.create_all(engine)
+
+    # create_all 不會替既有資料表補建索引，逐一檢查後建立
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+    # 舊資料庫的計數欄位可能為 NULL，補為 0 以便直接以 SQL 遞增
+    with engine.begin() as connection:
+        for column in (RegulationBaseline.found_count, RegulationBaseline.not_found_count):
+            connection.execute(
+                update(RegulationBaseline).where(column.is_(None)).values({column: 0})
+            )
+
     print(f"[Database] 資料庫已初始化: {get_database_path()}")
     return engine
@@ -0,0 +1,140 @@
+"""
+法規名稱索引
+
+以字元前綴樹 (trie) 保存某國家既有法規的正規化名稱，供法規發現時快速去重：
+- 完全相符查詢為 O(名稱長度)
+- 最長前綴查詢可找出「只差結尾幾個字」的近似名稱
+- 相似度查詢透過詞的倒排索引一次累計所有共用詞的名稱交集數，
+  沒有共同詞的名稱完全不需比對
+
+本模組只依賴標準型別且完整標註，可直接以 mypyc 編譯為 C 擴充。
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Optional
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """正規化法規名稱（小寫、去除前後空白）"""
+    return (name or "").lower().strip()
+
+
+def name_tokens(name: str) -> frozenset[str]:
+    """名稱的比對單位：以空白分詞，無法分詞時改用字元"""
+    return frozenset(name.split()) or frozenset(name)
+
+
+def jaccard(tokens1: frozenset[str], tokens2: frozenset[str]) -> float:
+    """兩個詞集合的 Jaccard 相似度"""
+    intersection = len(tokens1 & tokens2)
+    union = len(tokens1) + len(tokens2) - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+class _TrieNode:
+    """前綴樹節點"""
+
+    __slots__ = ("children", "terminal")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.terminal = False  # 此節點是否為某個完整名稱的結尾
+
+
+class RegulationNameIndex:
+    """單一國家的法規名稱索引"""
+
+    def __init__(self, names: Iterable[Optional[str]] = ()) -> None:
+        self._root = _TrieNode()
+        self._names: list[str] = []
+        self._tokens: list[frozenset[str]] = []
+        self._postings: dict[str, list[int]] = {}
+        self.add(*names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def add(self, *names: Optional[str]) -> None:
+        """加入名稱（自動正規化，空值與重複值會被忽略）"""
+        for name in names:
+            key = normalize_name(name)
+            if not key:
+                continue
+
+            node = self._root
+            for char in key:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = _TrieNode()
+                node = child
+            if not node.terminal:
+                node.terminal = True
+                tokens = name_tokens(key)
+                position = len(self._names)
+                self._names.append(key)
+                self._tokens.append(tokens)
+                for token in tokens:
+                    self._postings.setdefault(token, []).append(position)
+
+    def contains(self, name: str) -> bool:
+        """名稱是否完全相符（已正規化）"""
+        node = self._root
+        for char in name:
+            child = node.children.get(char)
+            if child is None:
+                return False
+            node = child
+        return node.terminal
+
+    def longest_prefix(self, name: str) -> int:
+        """
+        找出索引中屬於 name 前綴的最長名稱
+
+        Args:
+            name: 已正規化的名稱
+
+        Returns:
+            最長前綴名稱的長度，找不到時為 0
+        """
+        node = self._root
+        longest = 0
+        for depth, char in enumerate(name, start=1):
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+            if node.terminal:
+                longest = depth
+        return longest
+
+    def find_similar(self, name: str, threshold: float) -> Optional[str]:
+        """
+        找出 Jaccard 相似度超過門檻的既有名稱
+
+        Args:
+            name: 已正規化的名稱
+            threshold: 相似度門檻（不含，須 >= 0）
+
+        Returns:
+            第一個（依加入順序）相似的既有名稱，找不到時為 None
+        """
+        if not name:
+            return None
+
+        # 由倒排索引累計每個既有名稱與查詢名稱的共同詞數
+        tokens = name_tokens(name)
+        shared: dict[int, int] = {}
+        for token in tokens:
+            for position in self._postings.get(token, ()):
+                shared[position] = shared.get(position, 0) + 1
+
+        size = len(tokens)
+        for position in sorted(shared):
+            intersection = shared[position]
+            union = size + len(self._tokens[position]) - intersection
+            if intersection / union > threshold:
+                return self._names[position]
+        return None
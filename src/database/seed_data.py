@@ -7,6 +7,16 @@
 - 常見法規主題
 """
 
+from collections.abc import Iterable, Mapping, Sequence
+from functools import cache
+from types import MappingProxyType
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from ..utils.keyword_matcher import KeywordMatcher
+from ..utils.logging import get_logger
 from .models import (
     Country,
     Industry,
@@ -16,11 +26,15 @@ from .models import (
     init_database,
 )
 
+logger = get_logger(__name__)
+
+# 種子資料為唯讀常數：外層為 tuple，每筆資料為 MappingProxyType
+
 # ============================================================
 # 國家/地區資料 (40 個)
 # ============================================================
 
-COUNTRIES = [
+COUNTRIES = tuple(map(MappingProxyType, [
     # ===== 東亞 (6) =====
     {"code": "TW", "name_zh": "台灣", "name_en": "Taiwan", "region": "東亞"},
     {"code": "JP", "name_zh": "日本", "name_en": "Japan", "region": "東亞"},
@@ -81,14 +95,14 @@ COUNTRIES = [
     {"code": "NG", "name_zh": "奈及利亞", "name_en": "Nigeria", "region": "非洲"},
     {"code": "KE", "name_zh": "肯亞", "name_en": "Kenya", "region": "非洲"},
     {"code": "EG", "name_zh": "埃及", "name_en": "Egypt", "region": "非洲"},
-]
+]))
 
 
 # ============================================================
 # 產業別資料 (30 大產業)
 # ============================================================
 
-INDUSTRIES = [
+INDUSTRIES = tuple(map(MappingProxyType, [
     # ===== 金融服務業 (5) =====
     {
         "code": "banking",
@@ -346,14 +360,14 @@ INDUSTRIES = [
         "description": "公共服務機構",
         "keywords": ["public service", "公共服務"],
     },
-]
+]))
 
 
 # ============================================================
 # 法規主題資料
 # ============================================================
 
-TOPICS = [
+TOPICS = tuple(map(MappingProxyType, [
     {
         "code": "cybersecurity",
         "name_zh": "資訊安全",
@@ -450,60 +464,147 @@ TOPICS = [
             "ko": ["암호화폐", "가상자산", "디지털 자산"],
         },
     },
-]
+]))
+
+
+# ============================================================
+# 關鍵字反向索引
+# ============================================================
+
+def _build_keyword_index(pairs: Iterable[tuple[str, str]]) -> Mapping[str, tuple[str, ...]]:
+    """由 (關鍵字, 代碼) 建立唯讀的 {小寫關鍵字: (代碼, ...)}，代碼依資料順序且不重複"""
+    index: dict[str, dict[str, None]] = {}
+    for keyword, code in pairs:
+        index.setdefault(keyword.casefold(), {})[code] = None
+    return MappingProxyType({keyword: tuple(codes) for keyword, codes in index.items()})
+
+
+@cache
+def industry_keyword_index() -> Mapping[str, tuple[str, ...]]:
+    """
+    產業關鍵字反向索引（首次呼叫時建立）
+
+    Returns:
+        {小寫關鍵字: (產業代碼, ...)}
+    """
+    return _build_keyword_index(
+        (keyword, industry["code"])
+        for industry in INDUSTRIES
+        for keyword in industry["keywords"]
+    )
+
+
+@cache
+def topic_keyword_index() -> Mapping[str, tuple[str, ...]]:
+    """
+    主題關鍵字反向索引（合併 zh/en/ja/ko 各語言，首次呼叫時建立）
+
+    Returns:
+        {小寫關鍵字: (主題代碼, ...)}
+    """
+    return _build_keyword_index(
+        (keyword, topic["code"])
+        for topic in TOPICS
+        for keywords in topic["keywords"].values()
+        for keyword in keywords
+    )
+
+
+@cache
+def topic_keyword_matchers() -> Mapping[str, KeywordMatcher]:
+    """
+    各語言的主題關鍵字比對器（首次呼叫時建立）
+
+    已安裝 pyahocorasick 時每個語言編譯為一個 Aho-Corasick 自動機，一次掃描即可找出所有主題。
+
+    Returns:
+        {語言 (zh/en/ja/ko): 以主題代碼為標籤的 KeywordMatcher}
+    """
+    keywords_by_lang: dict[str, list[tuple[str, str]]] = {}
+    for topic in TOPICS:
+        for lang, keywords in topic["keywords"].items():
+            keywords_by_lang.setdefault(lang, []).extend((keyword, topic["code"]) for keyword in keywords)
+    return MappingProxyType({lang: KeywordMatcher(pairs) for lang, pairs in keywords_by_lang.items()})
+
+
+def match_topics(text: str, lang: Optional[str] = None) -> set[str]:
+    """
+    找出文字中提及的法規主題
+
+    Args:
+        text: 要比對的文字
+        lang: 語言代碼 (zh/en/ja/ko)；未指定時比對所有語言
+
+    Returns:
+        命中的主題代碼集合
+    """
+    matchers = topic_keyword_matchers()
+    if lang is not None:
+        matcher = matchers.get(lang)
+        return matcher.match(text) if matcher else set()
+    return set().union(*(matcher.match(text) for matcher in matchers.values()))
 
 
 # ============================================================
 # 初始化函數
 # ============================================================
 
+def _insert_missing(session, model, rows: Sequence[Mapping]) -> int:
+    """
+    批次新增資料表中尚未存在的資料（以 code 判斷，不提交）
+
+    以 INSERT ... ON CONFLICT DO NOTHING 一次寫入，已存在的代碼由資料庫略過，不需先查詢。
+
+    Args:
+        session: 資料庫 Session
+        model: Country / Industry / Topic
+        rows: 種子資料
+
+    Returns:
+        新增筆數
+    """
+    if not rows:
+        return 0
+    stmt = sqlite_insert(model).on_conflict_do_nothing(index_elements=["code"]).returning(model.id)
+    return len(session.execute(stmt, [dict(row) for row in rows]).all())
+
+
+def _seed(session, model, rows: Sequence[Mapping], label: str) -> int:
+    """
+    匯入一張參照資料表並顯示進度
+
+    Args:
+        session: 資料庫 Session
+        model: Country / Industry / Topic
+        rows: 種子資料
+        label: 顯示用的資料名稱（國家、產業、主題）
+
+    Returns:
+        新增筆數
+    """
+    count = _insert_missing(session, model, rows)
+    logger.info("[Seed] 已新增 {} 個{}，共 {} 個", count, label, len(rows))
+    return count
+
+
 def seed_countries(session):
     """匯入國家資料"""
-    print("[Seed] 匯入國家資料...")
-    count = 0
-    for data in COUNTRIES:
-        existing = session.query(Country).filter_by(code=data["code"]).first()
-        if not existing:
-            country = Country(**data)
-            session.add(country)
-            count += 1
-    session.commit()
-    print(f"[Seed] 已新增 {count} 個國家，共 {len(COUNTRIES)} 個")
+    _seed(session, Country, COUNTRIES, "國家")
 
 
 def seed_industries(session):
     """匯入產業資料"""
-    print("[Seed] 匯入產業資料...")
-    count = 0
-    for data in INDUSTRIES:
-        existing = session.query(Industry).filter_by(code=data["code"]).first()
-        if not existing:
-            industry = Industry(**data)
-            session.add(industry)
-            count += 1
-    session.commit()
-    print(f"[Seed] 已新增 {count} 個產業，共 {len(INDUSTRIES)} 個")
+    _seed(session, Industry, INDUSTRIES, "產業")
 
 
 def seed_topics(session):
     """匯入主題資料"""
-    print("[Seed] 匯入主題資料...")
-    count = 0
-    for data in TOPICS:
-        existing = session.query(Topic).filter_by(code=data["code"]).first()
-        if not existing:
-            topic = Topic(**data)
-            session.add(topic)
-            count += 1
-    session.commit()
-    print(f"[Seed] 已新增 {count} 個主題，共 {len(TOPICS)} 個")
+    _seed(session, Topic, TOPICS, "主題")
 
 
 def seed_all():
     """執行所有種子資料匯入"""
-    print("=" * 60)
-    print("[Seed] 開始匯入種子資料...")
-    print("=" * 60)
+    logger.info("[Seed] 開始匯入種子資料...")
 
     # 初始化資料庫
     init_database()
@@ -512,24 +613,25 @@ def seed_all():
     session = get_session()
 
     try:
-        seed_countries(session)
-        seed_industries(session)
-        seed_topics(session)
-
-        print("=" * 60)
-        print("[Seed] 種子資料匯入完成!")
-        print("=" * 60)
-
-        # 顯示統計
-        print("\n統計:")
-        print(f"  - 國家/地區: {session.query(Country).count()} 個")
-        print(f"  - 產業別: {session.query(Industry).count()} 個")
-        print(f"  - 法規主題: {session.query(Topic).count()} 個")
-        print(f"  - 法規 Baseline: {session.query(RegulationBaseline).count()} 筆")
+        # 三張表在同一個交易中寫入，只提交一次
+        with session.begin():
+            seed_countries(session)
+            seed_industries(session)
+            seed_topics(session)
+
+        # 顯示統計（以純量子查詢一次取得四張表的筆數）
+        counts = session.execute(select(*(
+            select(func.count()).select_from(model).scalar_subquery()
+            for model in (Country, Industry, Topic, RegulationBaseline)
+        ))).one()
+        logger.info(
+            "[Seed] 種子資料匯入完成! 國家/地區: {} 個，產業別: {} 個，法規主題: {} 個，法規 Baseline: {} 筆",
+            *counts,
+        )
 
     except Exception as e:
         session.rollback()
-        print(f"[Seed] 錯誤: {e}")
+        logger.error("[Seed] 錯誤: {}", e)
         raise
     finally:
         session.close()
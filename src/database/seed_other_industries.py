@@ -4,425 +4,207 @@
 新增醫療、科技、電信、電商、製造等產業的法規
 """
 
-
+import json
+import sys
+from collections import defaultdict
+from collections.abc import Mapping
+from functools import cache
+from itertools import chain
+from pathlib import Path
+from types import MappingProxyType
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from ..utils.logging import get_logger
 from .models import RegulationBaseline, get_session, init_database
 
-# === 醫療產業法規 ===
-HEALTHCARE_REGULATIONS = [
-    # 美國
-    {
-        "country_code": "US",
-        "name": "Health Insurance Portability and Accountability Act (HIPAA)",
-        "name_en": "Health Insurance Portability and Accountability Act",
-        "name_zh": "健康保險可攜性與責任法案",
-        "industry_code": "healthcare",
-        "topic_code": "privacy",
-        "regulation_type": "法律",
-        "issuing_authority": "U.S. Department of Health and Human Services",
-        "search_keywords": ["HIPAA", "HIPAA Privacy Rule", "HIPAA Security Rule"],
-        "applicable_industries": ["healthcare", "pharmaceutical", "medical_device", "insurance"],
-        "is_cross_industry": False,
-    },
-    {
-        "country_code": "US",
-        "name": "HITECH Act",
-        "name_en": "Health Information Technology for Economic and Clinical Health Act",
-        "name_zh": "健康資訊科技經濟與臨床健康法案",
-        "industry_code": "healthcare",
-        "topic_code": "cybersecurity",
-        "regulation_type": "法律",
-        "issuing_authority": "U.S. Department of Health and Human Services",
-        "search_keywords": ["HITECH Act", "Health IT"],
-        "applicable_industries": ["healthcare", "technology"],
-        "is_cross_industry": False,
-    },
-    {
-        "country_code": "US",
-        "name": "FDA 21 CFR Part 11",
-        "name_en": "FDA Electronic Records and Electronic Signatures",
-        "name_zh": "FDA 電子記錄與電子簽章規定",
-        "industry_code": "pharmaceutical",
-        "topic_code": "it_governance",
-        "regulation_type": "規則",
-        "issuing_authority": "U.S. Food and Drug Administration",
-        "search_keywords": ["FDA 21 CFR Part 11", "FDA electronic records"],
-        "applicable_industries": ["pharmaceutical", "medical_device", "healthcare"],
-        "is_cross_industry": False,
-    },
-    # 歐盟
-    {
-        "country_code": "EU",
-        "name": "Medical Device Regulation (MDR)",
-        "name_en": "Medical Device Regulation",
-        "name_zh": "醫療器材法規",
-        "industry_code": "medical_device",
-        "topic_code": "it_governance",
-        "regulation_type": "Regulation",
-        "issuing_authority": "European Commission",
-        "search_keywords": ["EU MDR", "Medical Device Regulation 2017/745"],
-        "applicable_industries": ["medical_device", "healthcare"],
-        "is_cross_industry": False,
-    },
-    {
-        "country_code": "EU",
-        "name": "In Vitro Diagnostic Regulation (IVDR)",
-        "name_en": "In Vitro Diagnostic Medical Devices Regulation",
-        "name_zh": "體外診斷醫療器材法規",
-        "industry_code": "medical_device",
-        "topic_code": "it_governance",
-        "regulation_type": "Regulation",
-        "issuing_authority": "European Commission",
-        "search_keywords": ["EU IVDR", "In Vitro Diagnostic Regulation"],
-        "applicable_industries": ["medical_device", "healthcare"],
-        "is_cross_industry": False,
-    },
-    # 台灣
-    {
-        "country_code": "TW",
-        "name": "醫療機構電子病歷製作及管理辦法",
-        "name_en": "Regulations for Electronic Medical Records",
-        "name_zh": "醫療機構電子病歷製作及管理辦法",
-        "industry_code": "healthcare",
-        "topic_code": "it_governance",
-        "regulation_type": "辦法",
-        "issuing_authority": "衛生福利部",
-        "search_keywords": ["電子病歷", "醫療機構電子病歷"],
-        "applicable_industries": ["healthcare"],
-        "is_cross_industry": False,
-    },
-    # 日本
-    {
-        "country_code": "JP",
-        "name": "医療情報システムの安全管理に関するガイドライン",
-        "name_en": "Guidelines for Security Management of Medical Information Systems",
-        "name_zh": "醫療資訊系統安全管理指引",
-        "industry_code": "healthcare",
-        "topic_code": "cybersecurity",
-        "regulation_type": "指引",
-        "issuing_authority": "厚生労働省",
-        "search_keywords": ["医療情報システム 安全管理 ガイドライン", "厚労省 医療情報"],
-        "applicable_industries": ["healthcare"],
-        "is_cross_industry": False,
-    },
-]
-
-# === 電信產業法規 ===
-TELECOM_REGULATIONS = [
-    # 美國
-    {
-        "country_code": "US",
-        "name": "Communications Act of 1934 (as amended)",
-        "name_en": "Communications Act",
-        "name_zh": "通訊法",
-        "industry_code": "telecom",
-        "topic_code": "it_governance",
-        "regulation_type": "法律",
-        "issuing_authority": "Federal Communications Commission",
-        "search_keywords": ["Communications Act FCC", "FCC regulations"],
-        "applicable_industries": ["telecom"],
-        "is_cross_industry": False,
-    },
-    {
-        "country_code": "US",
-        "name": "FCC Customer Proprietary Network Information (CPNI) Rules",
-        "name_en": "CPNI Rules",
-        "name_zh": "客戶專屬網路資訊規則",
-        "industry_code": "telecom",
-        "topic_code": "privacy",
-        "regulation_type": "規則",
-        "issuing_authority": "Federal Communications Commission",
-        "search_keywords": ["FCC CPNI", "Customer Proprietary Network Information"],
-        "applicable_industries": ["telecom"],
-        "is_cross_industry": False,
-    },
-    # 歐盟
-    {
-        "country_code": "EU",
-        "name": "European Electronic Communications Code (EECC)",
-        "name_en": "European Electronic Communications Code",
-        "name_zh": "歐洲電子通訊法典",
-        "industry_code": "telecom",
-        "topic_code": "it_governance",
-        "regulation_type": "Directive",
-        "issuing_authority": "European Commission",
-        "search_keywords": ["EECC", "European Electronic Communications Code"],
-        "applicable_industries": ["telecom"],
-        "is_cross_industry": False,
-    },
-    {
-        "country_code": "EU",
-        "name": "ePrivacy Directive",
-        "name_en": "Directive on Privacy and Electronic Communications",
-        "name_zh": "電子隱私指令",
-        "industry_code": "telecom",
-        "topic_code": "privacy",
-        "regulation_type": "Directive",
-        "issuing_authority": "European Commission",
-        "search_keywords": ["ePrivacy Directive", "cookie directive"],
-        "applicable_industries": ["telecom", "technology", "ecommerce"],
-        "is_cross_industry": False,
-    },
-    # 台灣
-    {
-        "country_code": "TW",
-        "name": "電信管理法",
-        "name_en": "Telecommunications Management Act",
-        "name_zh": "電信管理法",
-        "industry_code": "telecom",
-        "topic_code": "it_governance",
-        "regulation_type": "法律",
-        "issuing_authority": "國家通訊傳播委員會",
-        "search_keywords": ["電信管理法", "NCC 電信"],
-        "applicable_industries": ["telecom"],
-        "is_cross_industry": False,
-    },
-]
-
-# === 電商/科技產業法規 ===
-TECH_ECOMMERCE_REGULATIONS = [
-    # 歐盟
-    {
-        "country_code": "EU",
-        "name": "Digital Services Act (DSA)",
-        "name_en": "Digital Services Act",
-        "name_zh": "數位服務法",
-        "industry_code": "technology",
-        "topic_code": "it_governance",
-        "regulation_type": "Regulation",
-        "issuing_authority": "European Commission",
-        "search_keywords": ["EU DSA", "Digital Services Act"],
-        "applicable_industries": ["technology", "ecommerce", "social_media"],
-        "is_cross_industry": False,
-    },
-    {
-        "country_code": "EU",
-        "name": "Digital Markets Act (DMA)",
-        "name_en": "Digital Markets Act",
-        "name_zh": "數位市場法",
-        "industry_code": "technology",
-        "topic_code": "it_governance",
-        "regulation_type": "Regulation",
-        "issuing_authority": "European Commission",
-        "search_keywords": ["EU DMA", "Digital Markets Act"],
-        "applicable_industries": ["technology", "ecommerce"],
-        "is_cross_industry": False,
-    },
-    {
-        "country_code": "EU",
-        "name": "AI Act",
-        "name_en": "Artificial Intelligence Act",
-        "name_zh": "人工智慧法",
-        "industry_code": "technology",
-        "topic_code": "ai_regulation",
-        "regulation_type": "Regulation",
-        "issuing_authority": "European Commission",
-        "search_keywords": ["EU AI Act", "Artificial Intelligence Act"],
-        "applicable_industries": ["technology", "healthcare", "finance_general", "manufacturing"],
-        "is_cross_industry": True,
-    },
-    # 中國
-    {
-        "country_code": "CN",
-        "name": "电子商务法",
-        "name_en": "E-Commerce Law",
-        "name_zh": "電子商務法",
-        "industry_code": "ecommerce",
-        "topic_code": "it_governance",
-        "regulation_type": "法律",
-        "issuing_authority": "全国人民代表大会常务委员会",
-        "search_keywords": ["中国电子商务法", "E-Commerce Law China"],
-        "applicable_industries": ["ecommerce", "technology", "retail"],
-        "is_cross_industry": False,
-    },
-    {
-        "country_code": "CN",
-        "name": "生成式人工智能服务管理暂行办法",
-        "name_en": "Interim Measures for the Management of Generative AI Services",
-        "name_zh": "生成式人工智能服務管理暫行辦法",
-        "industry_code": "technology",
-        "topic_code": "ai_regulation",
-        "regulation_type": "辦法",
-        "issuing_authority": "国家互联网信息办公室",
-        "search_keywords": ["生成式人工智能 管理办法", "China generative AI"],
-        "applicable_industries": ["technology"],
-        "is_cross_industry": False,
-    },
-    # 日本
-    {
-        "country_code": "JP",
-        "name": "特定デジタルプラットフォームの透明性及び公正性の向上に関する法律",
-        "name_en": "Act on Improving Transparency and Fairness of Digital Platforms",
-        "name_zh": "特定數位平台透明性及公正性提升法",
-        "industry_code": "technology",
-        "topic_code": "it_governance",
-        "regulation_type": "法律",
-        "issuing_authority": "経済産業省",
-        "search_keywords": ["デジタルプラットフォーム 透明性", "Japan digital platform law"],
-        "applicable_industries": ["technology", "ecommerce"],
-        "is_cross_industry": False,
-    },
-]
-
-# === 能源/關鍵基礎設施法規 ===
-ENERGY_CRITICAL_INFRA_REGULATIONS = [
-    # 美國
-    {
-        "country_code": "US",
-        "name": "NERC Critical Infrastructure Protection (CIP) Standards",
-        "name_en": "NERC CIP Standards",
-        "name_zh": "NERC 關鍵基礎設施保護標準",
-        "industry_code": "energy",
-        "topic_code": "cybersecurity",
-        "regulation_type": "標準",
-        "issuing_authority": "North American Electric Reliability Corporation",
-        "search_keywords": ["NERC CIP", "NERC Critical Infrastructure Protection"],
-        "applicable_industries": ["energy", "utilities"],
-        "is_cross_industry": False,
-    },
-    # 歐盟
-    {
-        "country_code": "EU",
-        "name": "Critical Entities Resilience Directive (CER)",
-        "name_en": "Critical Entities Resilience Directive",
-        "name_zh": "關鍵實體韌性指令",
-        "industry_code": "energy",
-        "topic_code": "operational_resilience",
-        "regulation_type": "Directive",
-        "issuing_authority": "European Commission",
-        "search_keywords": ["EU CER Directive", "Critical Entities Resilience"],
-        "applicable_industries": ["energy", "utilities", "telecom", "healthcare", "finance_general"],
-        "is_cross_industry": True,
-    },
-    # 台灣
-    {
-        "country_code": "TW",
-        "name": "關鍵基礎設施安全防護指導綱要",
-        "name_en": "Critical Infrastructure Security Protection Guidelines",
-        "name_zh": "關鍵基礎設施安全防護指導綱要",
-        "industry_code": "energy",
-        "topic_code": "cybersecurity",
-        "regulation_type": "綱要",
-        "issuing_authority": "行政院",
-        "search_keywords": ["關鍵基礎設施 安全防護", "CI安全防護"],
-        "applicable_industries": ["energy", "utilities", "telecom", "finance_general", "healthcare"],
-        "is_cross_industry": True,
-    },
-]
-
-# === 製造業法規 ===
-MANUFACTURING_REGULATIONS = [
-    # 歐盟
-    {
-        "country_code": "EU",
-        "name": "Cyber Resilience Act (CRA)",
-        "name_en": "Cyber Resilience Act",
-        "name_zh": "網路韌性法",
-        "industry_code": "manufacturing",
-        "topic_code": "cybersecurity",
-        "regulation_type": "Regulation",
-        "issuing_authority": "European Commission",
-        "search_keywords": ["EU CRA", "Cyber Resilience Act"],
-        "applicable_industries": ["manufacturing", "technology", "retail"],
-        "is_cross_industry": False,
-    },
-    {
-        "country_code": "EU",
-        "name": "Machinery Regulation",
-        "name_en": "Machinery Regulation",
-        "name_zh": "機械法規",
-        "industry_code": "manufacturing",
-        "topic_code": "it_governance",
-        "regulation_type": "Regulation",
-        "issuing_authority": "European Commission",
-        "search_keywords": ["EU Machinery Regulation 2023/1230"],
-        "applicable_industries": ["manufacturing"],
-        "is_cross_industry": False,
-    },
-    # 德國
-    {
-        "country_code": "DE",
-        "name": "IT-Sicherheitsgesetz 2.0",
-        "name_en": "IT Security Act 2.0",
-        "name_zh": "資訊安全法 2.0",
-        "industry_code": "manufacturing",
-        "topic_code": "cybersecurity",
-        "regulation_type": "法律",
-        "issuing_authority": "Bundesministerium des Innern",
-        "search_keywords": ["IT-Sicherheitsgesetz 2.0", "Germany IT Security Act"],
-        "applicable_industries": ["manufacturing", "energy", "telecom", "healthcare"],
-        "is_cross_industry": True,
-    },
-]
+logger = get_logger(__name__)
+
+# 種子資料存放於 config/seed/other_industries.json，載入後為唯讀常數：
+# 外層為 tuple，每筆資料為 MappingProxyType
+_SEED_DATA_PATH = Path(__file__).parent.parent.parent / "config" / "seed" / "other_industries.json"
+
+# 種類少、重複出現的欄位（載入時 intern）
+_INTERNED_FIELDS = ("country_code", "industry_code", "topic_code", "regulation_type")
+
+# 載入時去除重複值的列表欄位
+_LIST_FIELDS = ("search_keywords", "applicable_industries")
+
+
+@cache
+def _load_seed_data() -> dict[str, tuple[Mapping, ...]]:
+    """載入其他產業法規種子資料（只解析一次）"""
+    with open(_SEED_DATA_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+
+    for rows in data.values():
+        for row in rows:
+            # 重複出現的代碼類字串共用同一個物件
+            for field in _INTERNED_FIELDS:
+                if isinstance(row.get(field), str):
+                    row[field] = sys.intern(row[field])
+            # 列表欄位去除重複值（保留原順序），並轉為唯讀 tuple
+            for field in _LIST_FIELDS:
+                if field in row:
+                    row[field] = tuple(dict.fromkeys(row[field]))
+    return {name: tuple(map(MappingProxyType, rows)) for name, rows in data.items()}
+
+
+# 各產業法規表（模組屬性，首次存取時才載入）；
+# 另提供 REGS_BY_COUNTRY / REGS_BY_INDUSTRY: {代碼: (法規, ...)} 分組索引
+_REGULATION_TABLES = (
+    "HEALTHCARE_REGULATIONS",  # 醫療產業
+    "TELECOM_REGULATIONS",  # 電信產業
+    "TECH_ECOMMERCE_REGULATIONS",  # 電商/科技產業
+    "ENERGY_CRITICAL_INFRA_REGULATIONS",  # 能源/關鍵基礎設施
+    "MANUFACTURING_REGULATIONS",  # 製造業
+)
+
+
+@cache
+def _regulation_groups() -> dict[str, Mapping[str, tuple[Mapping, ...]]]:
+    """
+    依國家與產業分組的法規索引（首次使用時建立）
+
+    產業分組包含主要產業與 applicable_industries 中列出的產業。
+    """
+    by_country: dict[str, list[Mapping]] = defaultdict(list)
+    by_industry: dict[str, list[Mapping]] = defaultdict(list)
+    data = _load_seed_data()
+    for reg in chain.from_iterable(data[name] for name in _REGULATION_TABLES):
+        by_country[reg["country_code"]].append(reg)
+        for industry in dict.fromkeys((reg["industry_code"], *reg.get("applicable_industries", ()))):
+            by_industry[industry].append(reg)
+
+    def freeze(groups: dict[str, list[Mapping]]) -> Mapping[str, tuple[Mapping, ...]]:
+        return MappingProxyType({key: tuple(regs) for key, regs in groups.items()})
+
+    return {"REGS_BY_COUNTRY": freeze(by_country), "REGS_BY_INDUSTRY": freeze(by_industry)}
+
+
+def __getattr__(name: str):
+    """延遲載入法規表與分組索引（PEP 562），匯入模組時不解析種子資料"""
+    if name in _REGULATION_TABLES:
+        value = globals()[name] = _load_seed_data()[name]
+        return value
+    if name in ("REGS_BY_COUNTRY", "REGS_BY_INDUSTRY"):
+        value = globals()[name] = _regulation_groups()[name]
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# 匯入時寫入的欄位，與 _insert_values 回傳的順序一致
+_INSERT_COLUMNS = (
+    "name", "name_en", "name_zh", "country_code", "industry_code", "topic_code",
+    "regulation_type", "issuing_authority", "search_keywords", "applicable_industries",
+    "is_cross_industry", "is_mandatory", "confidence_score", "source",
+)
+
+
+def _insert_values(reg: Mapping) -> tuple:
+    """種子法規對應 _INSERT_COLUMNS 的欄位值"""
+    return (
+        reg["name"], reg.get("name_en"), reg.get("name_zh"),
+        reg["country_code"], reg["industry_code"], reg["topic_code"],
+        reg.get("regulation_type"), reg.get("issuing_authority"),
+        reg.get("search_keywords", ()), reg.get("applicable_industries", ()),
+        reg.get("is_cross_industry", False),
+        True,  # is_mandatory
+        0.8,  # confidence_score
+        "seed",  # source
+    )
+
+
+# 既有法規查詢每批的鍵數（避免超過 SQLite 參數上限）
+_EXISTING_KEYS_CHUNK = 500
+
+
+def _existing_keys(session, keys: set[tuple[str, str]]) -> set[tuple[str, str]]:
+    """
+    查詢資料庫中已存在的 (名稱, 國家代碼)
+
+    Args:
+        session: 資料庫 Session
+        keys: 要檢查的 (名稱, 國家代碼) 組合
+
+    Returns:
+        已存在的組合
+    """
+    key_columns = tuple_(RegulationBaseline.name, RegulationBaseline.country_code)
+    ordered = list(keys)
+    existing: set[tuple[str, str]] = set()
+    for start in range(0, len(ordered), _EXISTING_KEYS_CHUNK):
+        chunk = ordered[start:start + _EXISTING_KEYS_CHUNK]
+        existing.update(session.execute(
+            select(RegulationBaseline.name, RegulationBaseline.country_code).where(key_columns.in_(chunk))
+        ).tuples())
+    return existing
 
 
 def seed_other_industries():
     """匯入其他產業的法規"""
     init_database()
-    session = get_session()
 
-    all_regulations = (
-        HEALTHCARE_REGULATIONS +
-        TELECOM_REGULATIONS +
-        TECH_ECOMMERCE_REGULATIONS +
-        ENERGY_CRITICAL_INFRA_REGULATIONS +
-        MANUFACTURING_REGULATIONS
-    )
+    # 依序逐表走訪，不另外串接成新的列表
+    data = _load_seed_data()
+    all_regulations = chain.from_iterable(data[name] for name in _REGULATION_TABLES)
 
-    added = 0
+    new_rows = []
     skipped = 0
+    added = 0
 
-    for reg_data in all_regulations:
-        # 檢查是否已存在
-        existing = session.query(RegulationBaseline).filter_by(
-            name=reg_data["name"],
-            country_code=reg_data["country_code"]
-        ).first()
-
-        if existing:
-            skipped += 1
-            continue
-
-        reg = RegulationBaseline(
-            name=reg_data["name"],
-            name_en=reg_data.get("name_en"),
-            name_zh=reg_data.get("name_zh"),
-            country_code=reg_data["country_code"],
-            industry_code=reg_data["industry_code"],
-            topic_code=reg_data["topic_code"],
-            regulation_type=reg_data.get("regulation_type"),
-            issuing_authority=reg_data.get("issuing_authority"),
-            search_keywords=reg_data.get("search_keywords", []),
-            applicable_industries=reg_data.get("applicable_industries", []),
-            is_cross_industry=reg_data.get("is_cross_industry", False),
-            is_mandatory=True,
-            confidence_score=0.8,
-            source="seed",
-        )
-        session.add(reg)
-        added += 1
-
-    session.commit()
-    session.close()
-
-    print("=== 其他產業法規匯入完成 ===")
-    print(f"新增: {added} 筆")
-    print(f"跳過（已存在）: {skipped} 筆")
+    # 查詢與寫入在同一個交易中完成，離開區塊時提交（發生錯誤則回滾）並關閉 Session
+    with get_session() as session, session.begin():
+        # 只查詢種子資料中出現的 (名稱, 國家) 組合，在記憶體中判斷是否已存在
+        keys = {
+            (reg["name"], reg["country_code"])
+            for reg in chain.from_iterable(data[name] for name in _REGULATION_TABLES)
+        }
+        existing = _existing_keys(session, keys)
+
+        # 重複執行時通常全部已存在，不需建立任何資料列
+        if existing >= keys:
+            logger.info("[Seed] 其他產業法規已是最新，共 {} 筆，略過匯入", len(keys))
+            return
+
+        for reg_data in all_regulations:
+            key = (reg_data["name"], reg_data["country_code"])
+            if key in existing:
+                skipped += 1
+                continue
+            existing.add(key)
+
+            new_rows.append(dict(zip(_INSERT_COLUMNS, _insert_values(reg_data))))
+
+        if new_rows:
+            # 唯一鍵衝突（其他程序同時寫入）時由資料庫略過
+            # 直接對資料表執行 Core INSERT，不經過 ORM 的批次寫入流程
+            table = RegulationBaseline.__table__
+            stmt = sqlite_insert(table).on_conflict_do_nothing(
+                index_elements=["name", "country_code", "industry_code"],
+            ).returning(table.c.id)
+            added = len(session.execute(stmt, new_rows).all())
+
+    logger.info("[Seed] 其他產業法規匯入完成，新增: {} 筆，跳過（已存在）: {} 筆", added, skipped)
 
 
 def print_industry_summary():
     """顯示各產業法規統計"""
     session = get_session()
-    regulations = session.query(RegulationBaseline).all()
 
-    # 統計各產業
-    industry_counts = {}
-    for reg in regulations:
-        ind = reg.industry_code
-        industry_counts[ind] = industry_counts.get(ind, 0) + 1
-
-    print("\n=== 各產業法規統計 ===")
-    for ind, count in sorted(industry_counts.items(), key=lambda x: -x[1]):
-        print(f"  {ind}: {count} 筆")
+    # 在資料庫中統計各產業（筆數相同時依首次出現順序）
+    reg_count = func.count(RegulationBaseline.id)
+    industry_counts = session.execute(
+        select(RegulationBaseline.industry_code, reg_count)
+        .group_by(RegulationBaseline.industry_code)
+        .order_by(reg_count.desc(), func.min(RegulationBaseline.id))
+    ).all()
+
+    logger.info(
+        "[Seed] 各產業法規統計: {}",
+        "，".join(f"{ind}: {count} 筆" for ind, count in industry_counts),
+    )
 
     session.close()
 
@@ -4,343 +4,186 @@
 這些是各國金融業資安的核心法規，用於確保搜尋穩定性
 """
 
+import json
+import sys
+from collections.abc import Iterable, Mapping
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+from ..utils.keyword_matcher import KeywordMatcher
+from ..utils.logging import get_logger
 from .manager import BaselineManager
-
-# ============================================================
-# 日本金融業資安法規
-# ============================================================
-
-JAPAN_REGULATIONS = [
-    {
-        "name": "サイバーセキュリティ基本法",
-        "name_en": "Basic Act on Cybersecurity",
-        "name_zh": "網路安全基本法",
-        "regulation_type": "法律",
-        "issuing_authority": "内閣",
-        "search_keywords": ["サイバーセキュリティ基本法", "Japan Basic Act Cybersecurity"],
-    },
-    {
-        "name": "金融分野におけるサイバーセキュリティに関するガイドライン",
-        "name_en": "Guidelines for Cybersecurity in the Financial Sector",
-        "name_zh": "金融領域網路安全指引",
-        "regulation_type": "指引",
-        "issuing_authority": "金融庁",
-        "search_keywords": ["金融分野 サイバーセキュリティ ガイドライン", "FSA cybersecurity guidelines"],
-    },
-    {
-        "name": "主要行等向けの総合的な監督指針",
-        "name_en": "Comprehensive Guidelines for Supervision of Major Banks",
-        "name_zh": "主要銀行綜合監督指針",
-        "regulation_type": "指針",
-        "issuing_authority": "金融庁",
-        "search_keywords": ["主要行 監督指針", "金融庁 主要行 監督"],
-    },
-    {
-        "name": "金融商品取引業者等向けの総合的な監督指針",
-        "name_en": "Comprehensive Guidelines for Supervision of Securities Companies",
-        "name_zh": "證券業監督指針",
-        "regulation_type": "指針",
-        "issuing_authority": "金融庁",
-        "search_keywords": ["金融商品取引業者 監督指針", "証券会社 監督指針"],
-    },
-    {
-        "name": "保険会社向けの総合的な監督指針",
-        "name_en": "Comprehensive Guidelines for Supervision of Insurance Companies",
-        "name_zh": "保險公司監督指針",
-        "regulation_type": "指針",
-        "issuing_authority": "金融庁",
-        "search_keywords": ["保険会社 監督指針", "金融庁 保険 監督"],
-    },
-    {
-        "name": "個人情報の保護に関する法律",
-        "name_en": "Act on the Protection of Personal Information",
-        "name_zh": "個人資料保護法",
-        "regulation_type": "法律",
-        "issuing_authority": "個人情報保護委員会",
-        "search_keywords": ["個人情報保護法", "Japan APPI personal information"],
-    },
-]
-
-
-# ============================================================
-# 新加坡金融業資安法規
-# ============================================================
-
-SINGAPORE_REGULATIONS = [
-    {
-        "name": "Technology Risk Management Guidelines",
-        "name_en": "Technology Risk Management Guidelines",
-        "name_zh": "技術風險管理指引",
-        "regulation_type": "指引",
-        "issuing_authority": "MAS",
-        "official_url": "https://www.mas.gov.sg/regulation/guidelines/technology-risk-management-guidelines",
-        "search_keywords": ["MAS Technology Risk Management Guidelines", "MAS TRM"],
-    },
-    {
-        "name": "Guidelines on Outsourcing",
-        "name_en": "Guidelines on Outsourcing",
-        "name_zh": "委外管理指引",
-        "regulation_type": "指引",
-        "issuing_authority": "MAS",
-        "search_keywords": ["MAS outsourcing guidelines", "MAS Guidelines on Outsourcing"],
-    },
-    {
-        "name": "Notice on Cyber Hygiene",
-        "name_en": "Notice on Cyber Hygiene",
-        "name_zh": "網路衛生通告",
-        "regulation_type": "通告",
-        "issuing_authority": "MAS",
-        "search_keywords": ["MAS cyber hygiene notice", "MAS Notice PSN01"],
-    },
-    {
-        "name": "Cybersecurity Act 2018",
-        "name_en": "Cybersecurity Act 2018",
-        "name_zh": "網路安全法",
-        "regulation_type": "法律",
-        "issuing_authority": "Singapore Government",
-        "search_keywords": ["Singapore Cybersecurity Act", "Cybersecurity Act 2018"],
-    },
-    {
-        "name": "Personal Data Protection Act",
-        "name_en": "Personal Data Protection Act",
-        "name_zh": "個人資料保護法",
-        "regulation_type": "法律",
-        "issuing_authority": "PDPC",
-        "search_keywords": ["PDPA Singapore", "Singapore Personal Data Protection Act"],
-    },
-    {
-        "name": "Payment Services Act",
-        "name_en": "Payment Services Act",
-        "name_zh": "支付服務法",
-        "regulation_type": "法律",
-        "issuing_authority": "MAS",
-        "search_keywords": ["Payment Services Act Singapore", "MAS Payment Services Act"],
-    },
-]
-
-
-# ============================================================
-# 韓國金融業資安法規
-# ============================================================
-
-KOREA_REGULATIONS = [
-    {
-        "name": "전자금융거래법",
-        "name_en": "Electronic Financial Transactions Act",
-        "name_zh": "電子金融交易法",
-        "regulation_type": "法律",
-        "issuing_authority": "금융위원회 (FSC)",
-        "search_keywords": ["전자금융거래법", "Korea Electronic Financial Transactions Act"],
-    },
-    {
-        "name": "전자금융감독규정",
-        "name_en": "Electronic Financial Supervision Regulations",
-        "name_zh": "電子金融監督規定",
-        "regulation_type": "規定",
-        "issuing_authority": "금융감독원 (FSS)",
-        "search_keywords": ["전자금융감독규정", "Korea electronic financial supervision"],
-    },
-    {
-        "name": "신용정보의 이용 및 보호에 관한 법률",
-        "name_en": "Credit Information Act",
-        "name_zh": "信用情報法",
-        "regulation_type": "法律",
-        "issuing_authority": "금융위원회 (FSC)",
-        "search_keywords": ["신용정보법", "Korea Credit Information Act"],
-    },
-    {
-        "name": "개인정보 보호법",
-        "name_en": "Personal Information Protection Act",
-        "name_zh": "個人資訊保護法",
-        "regulation_type": "法律",
-        "issuing_authority": "개인정보보호위원회",
-        "search_keywords": ["개인정보보호법", "Korea PIPA personal information"],
-    },
-]
-
-
-# ============================================================
-# 台灣金融業資安法規
-# ============================================================
-
-TAIWAN_REGULATIONS = [
-    {
-        "name": "資通安全管理法",
-        "name_en": "Cyber Security Management Act",
-        "name_zh": "資通安全管理法",
-        "regulation_type": "法律",
-        "issuing_authority": "數位發展部",
-        "search_keywords": ["資通安全管理法", "Taiwan Cyber Security Management Act"],
-    },
-    {
-        "name": "個人資料保護法",
-        "name_en": "Personal Data Protection Act",
-        "name_zh": "個人資料保護法",
-        "regulation_type": "法律",
-        "issuing_authority": "法務部",
-        "search_keywords": ["個人資料保護法", "Taiwan Personal Data Protection Act"],
-    },
-    {
-        "name": "金融資安行動方案",
-        "name_en": "Financial Cybersecurity Action Plan",
-        "name_zh": "金融資安行動方案",
-        "regulation_type": "方案",
-        "issuing_authority": "金管會",
-        "search_keywords": ["金融資安行動方案", "金管會 資安"],
-    },
-    {
-        "name": "金融機構辦理電腦系統資訊安全評估辦法",
-        "name_en": "Regulations Governing Information Security Assessment of Financial Institutions",
-        "name_zh": "金融機構辦理電腦系統資訊安全評估辦法",
-        "regulation_type": "辦法",
-        "issuing_authority": "金管會",
-        "search_keywords": ["金融機構 資訊安全評估", "金管會 資安評估"],
-    },
-]
-
-
-# ============================================================
-# 德國金融業資安法規
-# ============================================================
-
-GERMANY_REGULATIONS = [
-    {
-        "name": "Bankaufsichtliche Anforderungen an die IT (BAIT)",
-        "name_en": "Supervisory Requirements for IT in Financial Institutions (BAIT)",
-        "name_zh": "銀行業 IT 監管要求",
-        "regulation_type": "指引",
-        "issuing_authority": "BaFin",
-        "search_keywords": ["BaFin BAIT", "BAIT Bankaufsichtliche"],
-    },
-    {
-        "name": "Versicherungsaufsichtliche Anforderungen an die IT (VAIT)",
-        "name_en": "Supervisory Requirements for IT in Insurance Companies (VAIT)",
-        "name_zh": "保險業 IT 監管要求",
-        "regulation_type": "指引",
-        "issuing_authority": "BaFin",
-        "search_keywords": ["BaFin VAIT", "VAIT Versicherungsaufsichtliche"],
-    },
-    {
-        "name": "Mindestanforderungen an das Risikomanagement (MaRisk)",
-        "name_en": "Minimum Requirements for Risk Management (MaRisk)",
-        "name_zh": "風險管理最低要求",
-        "regulation_type": "指引",
-        "issuing_authority": "BaFin",
-        "search_keywords": ["BaFin MaRisk", "MaRisk Mindestanforderungen"],
-    },
-]
-
-
-# ============================================================
-# 歐盟金融業資安法規
-# ============================================================
-
-EU_REGULATIONS = [
-    {
-        "name": "Digital Operational Resilience Act (DORA)",
-        "name_en": "Digital Operational Resilience Act (DORA)",
-        "name_zh": "數位營運韌性法案",
-        "regulation_type": "規則",
-        "issuing_authority": "European Union",
-        "search_keywords": ["EU DORA regulation", "Digital Operational Resilience Act"],
-    },
-    {
-        "name": "Network and Information Security Directive 2 (NIS2)",
-        "name_en": "Network and Information Security Directive 2 (NIS2)",
-        "name_zh": "網路與資訊安全指令 2",
-        "regulation_type": "指令",
-        "issuing_authority": "European Union",
-        "search_keywords": ["NIS2 Directive", "NIS2 financial sector"],
-    },
-    {
-        "name": "General Data Protection Regulation (GDPR)",
-        "name_en": "General Data Protection Regulation (GDPR)",
-        "name_zh": "一般資料保護規則",
-        "regulation_type": "規則",
-        "issuing_authority": "European Union",
-        "search_keywords": ["GDPR", "EU data protection regulation"],
-    },
-    {
-        "name": "Payment Services Directive 2 (PSD2)",
-        "name_en": "Payment Services Directive 2 (PSD2)",
-        "name_zh": "支付服務指令 2",
-        "regulation_type": "指令",
-        "issuing_authority": "European Union",
-        "search_keywords": ["PSD2", "Payment Services Directive security"],
-    },
-]
-
-
-# ============================================================
-# 澳洲金融業資安法規
-# ============================================================
-
-AUSTRALIA_REGULATIONS = [
-    {
-        "name": "Prudential Standard CPS 234 Information Security",
-        "name_en": "Prudential Standard CPS 234 Information Security",
-        "name_zh": "審慎標準 CPS 234 資訊安全",
-        "regulation_type": "審慎標準",
-        "issuing_authority": "APRA",
-        "search_keywords": ["APRA CPS 234", "CPS 234 Information Security"],
-    },
-    {
-        "name": "Prudential Standard CPS 230 Operational Risk Management",
-        "name_en": "Prudential Standard CPS 230 Operational Risk Management",
-        "name_zh": "審慎標準 CPS 230 營運風險管理",
-        "regulation_type": "審慎標準",
-        "issuing_authority": "APRA",
-        "search_keywords": ["APRA CPS 230", "CPS 230 Operational Risk"],
-    },
-    {
-        "name": "Privacy Act 1988",
-        "name_en": "Privacy Act 1988",
-        "name_zh": "隱私法",
-        "regulation_type": "法律",
-        "issuing_authority": "Australian Government",
-        "search_keywords": ["Australia Privacy Act", "Privacy Act 1988"],
-    },
-]
-
-
-# ============================================================
-# 美國金融業資安法規
-# ============================================================
-
-US_REGULATIONS = [
-    {
-        "name": "Gramm-Leach-Bliley Act (GLBA)",
-        "name_en": "Gramm-Leach-Bliley Act (GLBA)",
-        "name_zh": "金融服務現代化法案",
-        "regulation_type": "法律",
-        "issuing_authority": "US Congress",
-        "search_keywords": ["GLBA", "Gramm-Leach-Bliley Act"],
-    },
-    {
-        "name": "NIST Cybersecurity Framework",
-        "name_en": "NIST Cybersecurity Framework",
-        "name_zh": "NIST 網路安全框架",
-        "regulation_type": "框架",
-        "issuing_authority": "NIST",
-        "search_keywords": ["NIST Cybersecurity Framework", "NIST CSF"],
-    },
-    {
-        "name": "FFIEC IT Examination Handbook",
-        "name_en": "FFIEC IT Examination Handbook",
-        "name_zh": "FFIEC IT 檢查手冊",
-        "regulation_type": "指引",
-        "issuing_authority": "FFIEC",
-        "search_keywords": ["FFIEC IT Examination Handbook", "FFIEC cybersecurity"],
-    },
-    {
-        "name": "New York DFS Cybersecurity Regulation (23 NYCRR 500)",
-        "name_en": "New York DFS Cybersecurity Regulation",
-        "name_zh": "紐約金融服務局網路安全法規",
-        "regulation_type": "規則",
-        "issuing_authority": "NY DFS",
-        "search_keywords": ["23 NYCRR 500", "NY DFS Cybersecurity"],
-    },
-]
+from .models import encode_json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 依安裝環境而定
+    orjson = None
+
+logger = get_logger(__name__)
+
+# 種子資料存放於 config/seed/regulations.json，鍵為各國法規表名稱；
+# 載入後為唯讀常數：外層為 tuple，每筆資料為 MappingProxyType
+_SEED_DATA_PATH = Path(__file__).parent.parent.parent / "config" / "seed" / "regulations.json"
+
+# 各國法規資料: (國家代碼, 產業代碼, 主題代碼, 法規表名稱)
+_COUNTRY_TABLES = (
+    ("JP", "finance_general", "cybersecurity", "JAPAN_REGULATIONS"),
+    ("SG", "finance_general", "cybersecurity", "SINGAPORE_REGULATIONS"),
+    ("KR", "finance_general", "cybersecurity", "KOREA_REGULATIONS"),
+    ("TW", "finance_general", "cybersecurity", "TAIWAN_REGULATIONS"),
+    ("DE", "finance_general", "cybersecurity", "GERMANY_REGULATIONS"),
+    ("EU", "finance_general", "cybersecurity", "EU_REGULATIONS"),
+    ("AU", "finance_general", "cybersecurity", "AUSTRALIA_REGULATIONS"),
+    ("US", "finance_general", "cybersecurity", "US_REGULATIONS"),
+)
+
+
+@cache
+def _load_seed_data() -> dict[str, tuple[Mapping, ...]]:
+    """載入必搜法規種子資料（只解析一次，已安裝 orjson 時以其解析）"""
+    raw = _SEED_DATA_PATH.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return {name: tuple(map(MappingProxyType, rows)) for name, rows in data.items()}
+
+
+@cache
+def _all_regulations() -> tuple[tuple[str, str, str, tuple[Mapping, ...]], ...]:
+    """各國法規資料: (國家代碼, 產業代碼, 主題代碼, 法規列表)"""
+    data = _load_seed_data()
+    return tuple(
+        (country_code, industry_code, topic_code, data[table])
+        for country_code, industry_code, topic_code, table in _COUNTRY_TABLES
+    )
+
+
+class SeedRegulation(NamedTuple):
+    """必搜法規資料列，欄位與 BaselineManager.add_regulation 的參數相同"""
+    name: str
+    country_code: str
+    industry_code: str
+    topic_code: str
+    name_en: Optional[str] = None
+    name_zh: Optional[str] = None
+    regulation_type: Optional[str] = None
+    issuing_authority: Optional[str] = None
+    official_url: Optional[str] = None
+    search_keywords: Optional[tuple[str, ...]] = None
+    is_mandatory: bool = True
+    source: str = "manual"
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """intern 重複出現的字串（類型、發布機關），與其他種子模組共用同一個物件"""
+    return sys.intern(value) if value is not None else None
+
+
+def build_seed_rows(tables: Iterable[tuple[str, str, str, Iterable[Mapping]]]) -> tuple[SeedRegulation, ...]:
+    """
+    將各國法規表攤平為 SeedRegulation 資料列
+
+    Args:
+        tables: (國家代碼, 產業代碼, 主題代碼, 法規列表) 序列
+
+    Returns:
+        依序攤平的資料列（重複出現的字串已 intern、關鍵字為 tuple）
+    """
+    return tuple(
+        SeedRegulation(
+            name=reg["name"],
+            country_code=sys.intern(country_code),
+            industry_code=sys.intern(industry_code),
+            topic_code=sys.intern(topic_code),
+            name_en=reg.get("name_en"),
+            name_zh=reg.get("name_zh"),
+            regulation_type=_intern(reg.get("regulation_type")),
+            issuing_authority=_intern(reg.get("issuing_authority")),
+            official_url=reg.get("official_url"),
+            search_keywords=tuple(map(sys.intern, reg["search_keywords"])) if reg.get("search_keywords") else None,
+        )
+        for country_code, industry_code, topic_code, regulations in tables
+        for reg in regulations
+    )
+
+
+@cache
+def _regulation_rows() -> tuple[SeedRegulation, ...]:
+    """攤平後的資料列（已含國家、產業、主題代碼），首次使用時才建立"""
+    return build_seed_rows(_all_regulations())
+
+
+def to_insert_row(row: SeedRegulation) -> dict:
+    """寫入用的欄位資料（add_regulations_bulk 的一筆），search_keywords 預先序列化為 JSON"""
+    return {
+        **row._asdict(),
+        "search_keywords": encode_json(row.search_keywords) if row.search_keywords else None,
+    }
+
+
+@cache
+def _insert_rows() -> tuple[Mapping, ...]:
+    """寫入用的資料列（同一行程重複匯入時不再序列化）"""
+    return tuple(MappingProxyType(to_insert_row(row)) for row in _regulation_rows())
+
+
+@cache
+def _regulations_index() -> Mapping[tuple[str, str], tuple[SeedRegulation, ...]]:
+    """依 (國家代碼, 主題代碼) 分組的資料列（首次使用時建立）"""
+    groups: dict[tuple[str, str], list[SeedRegulation]] = {}
+    for row in _regulation_rows():
+        groups.setdefault((row.country_code, row.topic_code), []).append(row)
+    return MappingProxyType({key: tuple(rows) for key, rows in groups.items()})
+
+
+def get_regulations(country_code: str, topic_code: str = "cybersecurity") -> tuple[SeedRegulation, ...]:
+    """
+    取得某國家、主題的必搜法規
+
+    Args:
+        country_code: 國家代碼
+        topic_code: 主題代碼
+
+    Returns:
+        必搜法規資料列（依種子資料順序），沒有時為空 tuple
+    """
+    return _regulations_index().get((country_code, topic_code), ())
+
+
+@cache
+def regulation_keyword_matcher() -> KeywordMatcher:
+    """
+    必搜法規的關鍵字比對器（首次呼叫時建立）
+
+    以法規名稱（原文/英文/中文）與搜尋關鍵字為比對字詞，標籤為 (國家代碼, 法規名稱)。
+
+    Returns:
+        KeywordMatcher，可用 match(text) 一次找出文字中提及的所有必搜法規
+    """
+    return KeywordMatcher(
+        (keyword, (row.country_code, row.name))
+        for row in _regulation_rows()
+        for keyword in (row.name, row.name_en, row.name_zh, *(row.search_keywords or ()))
+        if keyword
+    )
+
+
+def __getattr__(name: str):
+    """延遲載入法規表、ALL_REGULATIONS、ALL_REGULATION_ROWS 與 REGULATIONS_INDEX（PEP 562），匯入模組時不解析種子資料"""
+    if name in {table for *_, table in _COUNTRY_TABLES}:
+        value = globals()[name] = _load_seed_data()[name]
+        return value
+    if name == "ALL_REGULATIONS":
+        value = globals()[name] = _all_regulations()
+        return value
+    if name == "ALL_REGULATION_ROWS":
+        value = globals()[name] = _regulation_rows()
+        return value
+    if name == "REGULATIONS_INDEX":
+        value = globals()[name] = _regulations_index()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================================
@@ -349,58 +192,31 @@ US_REGULATIONS = [
 
 def seed_regulations():
     """匯入所有必搜法規"""
-    print("=" * 60)
-    print("[Seed] 開始匯入必搜法規...")
-    print("=" * 60)
+    logger.info("[Seed] 開始匯入必搜法規...")
 
     manager = BaselineManager()
 
-    # 定義各國法規資料
-    ALL_REGULATIONS = [
-        ("JP", "finance_general", "cybersecurity", JAPAN_REGULATIONS),
-        ("SG", "finance_general", "cybersecurity", SINGAPORE_REGULATIONS),
-        ("KR", "finance_general", "cybersecurity", KOREA_REGULATIONS),
-        ("TW", "finance_general", "cybersecurity", TAIWAN_REGULATIONS),
-        ("DE", "finance_general", "cybersecurity", GERMANY_REGULATIONS),
-        ("EU", "finance_general", "cybersecurity", EU_REGULATIONS),
-        ("AU", "finance_general", "cybersecurity", AUSTRALIA_REGULATIONS),
-        ("US", "finance_general", "cybersecurity", US_REGULATIONS),
-    ]
-
-    total_count = 0
-
-    for country_code, industry_code, topic_code, regulations in ALL_REGULATIONS:
-        print(f"\n[{country_code}] 匯入 {len(regulations)} 筆法規...")
-
-        for reg in regulations:
-            manager.add_regulation(
-                name=reg["name"],
-                name_en=reg.get("name_en"),
-                name_zh=reg.get("name_zh"),
-                country_code=country_code,
-                industry_code=industry_code,
-                topic_code=topic_code,
-                regulation_type=reg.get("regulation_type"),
-                issuing_authority=reg.get("issuing_authority"),
-                official_url=reg.get("official_url"),
-                search_keywords=reg.get("search_keywords"),
-                is_mandatory=True,
-                source="manual",
-            )
-            total_count += 1
-
-    print("\n" + "=" * 60)
-    print(f"[Seed] 匯入完成! 共 {total_count} 筆必搜法規")
-    print("=" * 60)
+    logger.info(
+        "[Seed] 各國法規筆數: {}",
+        "，".join(f"{country_code}: {len(regulations)} 筆" for country_code, _, _, regulations in _all_regulations()),
+    )
+
+    # 以單一交易批次寫入
+    rows = [dict(row) for row in _insert_rows()]
+    total_count = len(rows)
+    # 已存在的法規以種子資料更新英文名稱與關鍵字；回傳新增與內容有變動的合計筆數
+    changed = manager.add_regulations_bulk(rows, upsert=True)
 
     # 顯示統計
-    stats = manager.get_statistics()
-    print("\n統計:")
-    print(f"  - 法規總數: {stats['total']} 筆")
-    print(f"  - 必搜法規: {stats['mandatory']} 筆")
-    print("\n按國家:")
-    for country, count in stats["by_country"].items():
-        print(f"    {country}: {count} 筆")
+    stats = manager.get_statistics(include_industries=False)
+    logger.info(
+        "[Seed] 匯入完成! 共 {} 筆必搜法規（新增或更新 {} 筆），法規總數: {} 筆，必搜法規: {} 筆，按國家: {}",
+        total_count,
+        changed,
+        stats["total"],
+        stats["mandatory"],
+        "，".join(f"{country}: {count} 筆" for country, count in stats["by_country"].items()),
+    )
 
     manager.close()
 
@@ -7,9 +7,93 @@
 3. 適用於多個金融子產業（銀行、證券、保險等）
 """
 
-from sqlalchemy import text
-
-from .models import RegulationBaseline, get_session, init_database
+from sqlalchemy import or_, select, text, update
+
+from ..utils.keyword_matcher import KeywordMatcher
+from .models import RegulationBaseline, encode_json, get_session, init_database
+
+# 定義跨產業通用法規的關鍵字
+CROSS_INDUSTRY_KEYWORDS = (
+    # 個資/隱私法規
+    'GDPR', 'PDPA', 'POPIA', 'LGPD', 'PIPEDA', 'CCPA', 'Privacy',
+    '個人資料保護', '個人情報保護', '개인정보', '个人信息保护',
+    'Data Protection', 'Datenschutz', '隱私', '隐私',
+    # 資安法規
+    'Cybersecurity Act', 'Cybercrimes', '資通安全管理法', '网络安全法',
+    'サイバーセキュリティ基本法', 'NIS2', 'NIST',
+    # 資訊科技法規
+    'Information Technology Act', 'IT Act',
+)
+
+# 定義金融業專用法規的關鍵字
+FINANCE_SPECIFIC_KEYWORDS = (
+    'MAS', 'HKMA', 'APRA', 'FCA', 'PRA', 'SEC', 'FINMA', 'BaFin',
+    'OSFI', 'OJK', 'BNM', 'BOT', 'BSP', 'RBI', 'SAMA', 'CBUAE',
+    'Banking', 'Bank', '銀行', '金融', 'Financial',
+    'Insurance', '保険', '保險', 'Securities', '証券', '證券',
+    'DORA', 'CPS 234', 'CPS 230', 'B-13', 'B-10',
+    '電子金融', '전자금융',
+)
+
+# 金融子產業對應
+FINANCE_SUB_INDUSTRIES = ['banking', 'securities', 'insurance', 'fintech', 'finance_general']
+
+# 跨產業通用法規適用的產業
+ALL_INDUSTRIES = [
+    'banking', 'securities', 'insurance', 'fintech', 'finance_general',
+    'healthcare', 'technology', 'telecom', 'ecommerce', 'manufacturing',
+    'energy', 'retail', 'logistics', 'education', 'government'
+]
+
+# 關鍵字分類標籤
+_CROSS = "cross"
+_FINANCE = "finance"
+
+# 兩組關鍵字合併為單一比對器（關鍵字於建立時即 casefold，不分大小寫），
+# 每筆法規名稱只需小寫化與掃描一次即可得知命中的分類
+_APPLICABILITY_MATCHER = KeywordMatcher([
+    *((kw, _CROSS) for kw in CROSS_INDUSTRY_KEYWORDS),
+    *((kw, _FINANCE) for kw in FINANCE_SPECIFIC_KEYWORDS),
+])
+
+# 舊資料庫可能缺少的欄位: {欄位名稱: 欄位型別}
+_REQUIRED_COLUMNS = {
+    "applicable_industries": "TEXT",
+    "is_cross_industry": "INTEGER DEFAULT 0",
+}
+
+# 每個 UPDATE 語句的 id 數（避免超過 SQLite 參數上限）
+_UPDATE_IDS_CHUNK = 500
+
+# 讀取法規名稱時每批載入的筆數
+_READ_BATCH_SIZE = 1000
+
+
+def _bulk_mark(session, ids: list[int], is_cross_industry: bool, industries: list[str]) -> None:
+    """
+    以 UPDATE ... WHERE id IN (...) 批次設定法規的產業適用性
+
+    Args:
+        session: 資料庫 Session
+        ids: 要更新的法規 id
+        is_cross_industry: 是否為跨產業通用法規
+        industries: 適用產業列表
+    """
+    # 同一批法規寫入相同的值，JSON 只序列化一次；內容未變動的資料列不改寫
+    payload = encode_json(industries)
+    for start in range(0, len(ids), _UPDATE_IDS_CHUNK):
+        chunk = ids[start:start + _UPDATE_IDS_CHUNK]
+        session.execute(
+            update(RegulationBaseline)
+            .where(
+                RegulationBaseline.id.in_(chunk),
+                or_(
+                    RegulationBaseline.is_cross_industry.is_distinct_from(is_cross_industry),
+                    RegulationBaseline.applicable_industries.is_distinct_from(payload),
+                ),
+            )
+            .values(is_cross_industry=is_cross_industry, applicable_industries=payload)
+        )
 
 
 def update_industry_applicability():
@@ -18,87 +102,51 @@ def update_industry_applicability():
     # 確保新欄位存在
     init_database()
 
-    # 使用 raw SQL 添加新欄位（如果不存在）
+    # 使用 raw SQL 添加新欄位（如果不存在）：先讀取現有欄位，只補上缺少的欄位並一次提交
     session = get_session()
-    try:
-        session.execute(text("ALTER TABLE regulation_baselines ADD COLUMN applicable_industries TEXT"))
-        session.commit()
-        print("✅ 新增 applicable_industries 欄位")
-    except Exception:
-        session.rollback()
-
-    try:
-        session.execute(text("ALTER TABLE regulation_baselines ADD COLUMN is_cross_industry INTEGER DEFAULT 0"))
-        session.commit()
-        print("✅ 新增 is_cross_industry 欄位")
-    except Exception:
-        session.rollback()
-
+    existing_columns = {row[1] for row in session.execute(text("PRAGMA table_info(regulation_baselines)"))}
+    for column, column_type in _REQUIRED_COLUMNS.items():
+        if column not in existing_columns:
+            session.execute(text(f"ALTER TABLE regulation_baselines ADD COLUMN {column} {column_type}"))
+            print(f"✅ 新增 {column} 欄位")
+    session.commit()
     session.close()
 
-    # 定義跨產業通用法規的關鍵字
-    CROSS_INDUSTRY_KEYWORDS = [
-        # 個資/隱私法規
-        'GDPR', 'PDPA', 'POPIA', 'LGPD', 'PIPEDA', 'CCPA', 'Privacy',
-        '個人資料保護', '個人情報保護', '개인정보', '个人信息保护',
-        'Data Protection', 'Datenschutz', '隱私', '隐私',
-        # 資安法規
-        'Cybersecurity Act', 'Cybercrimes', '資通安全管理法', '网络安全法',
-        'サイバーセキュリティ基本法', 'NIS2', 'NIST',
-        # 資訊科技法規
-        'Information Technology Act', 'IT Act',
-    ]
-
-    # 定義金融業專用法規的關鍵字
-    FINANCE_SPECIFIC_KEYWORDS = [
-        'MAS', 'HKMA', 'APRA', 'FCA', 'PRA', 'SEC', 'FINMA', 'BaFin',
-        'OSFI', 'OJK', 'BNM', 'BOT', 'BSP', 'RBI', 'SAMA', 'CBUAE',
-        'Banking', 'Bank', '銀行', '金融', 'Financial',
-        'Insurance', '保険', '保險', 'Securities', '証券', '證券',
-        'DORA', 'CPS 234', 'CPS 230', 'B-13', 'B-10',
-        '電子金融', '전자금융',
-    ]
-
-    # 金融子產業對應
-    FINANCE_SUB_INDUSTRIES = ['banking', 'securities', 'insurance', 'fintech', 'finance_general']
-
+    # 只讀取比對需要的欄位，分批載入，不建立 ORM 物件
     session = get_session()
-    regulations = session.query(RegulationBaseline).all()
+    names = session.execute(
+        select(
+            RegulationBaseline.id, RegulationBaseline.name,
+            RegulationBaseline.name_en, RegulationBaseline.name_zh,
+        ).execution_options(yield_per=_READ_BATCH_SIZE)
+    )
 
     updated_count = 0
-    cross_industry_count = 0
     finance_specific_count = 0
+    cross_ids: list[int] = []
+    finance_ids: list[int] = []
 
-    for reg in regulations:
-        name_combined = f"{reg.name} {reg.name_en or ''} {reg.name_zh or ''}"
+    for reg_id, name, name_en, name_zh in names:
+        categories = _APPLICABILITY_MATCHER.match(f"{name} {name_en or ''} {name_zh or ''}")
 
         # 檢查是否為跨產業法規
-        is_cross = any(kw.lower() in name_combined.lower() for kw in CROSS_INDUSTRY_KEYWORDS)
-
-        if is_cross:
+        if _CROSS in categories:
             # 跨產業通用法規 - 適用於所有產業
-            reg.is_cross_industry = True
-            reg.applicable_industries = [
-                'banking', 'securities', 'insurance', 'fintech', 'finance_general',
-                'healthcare', 'technology', 'telecom', 'ecommerce', 'manufacturing',
-                'energy', 'retail', 'logistics', 'education', 'government'
-            ]
-            cross_industry_count += 1
+            cross_ids.append(reg_id)
         else:
-            # 金融業專用法規
-            is_finance = any(kw.lower() in name_combined.lower() for kw in FINANCE_SPECIFIC_KEYWORDS)
-
-            if is_finance:
-                reg.is_cross_industry = False
-                reg.applicable_industries = FINANCE_SUB_INDUSTRIES
+            # 金融業專用法規；未命中關鍵字者預設為金融業
+            if _FINANCE in categories:
                 finance_specific_count += 1
-            else:
-                # 預設為金融業
-                reg.is_cross_industry = False
-                reg.applicable_industries = FINANCE_SUB_INDUSTRIES
+            finance_ids.append(reg_id)
 
         updated_count += 1
 
+    cross_industry_count = len(cross_ids)
+
+    # 兩類法規各以少數幾個 UPDATE 語句寫入
+    _bulk_mark(session, cross_ids, True, ALL_INDUSTRIES)
+    _bulk_mark(session, finance_ids, False, FINANCE_SUB_INDUSTRIES)
+
     session.commit()
     session.close()
 
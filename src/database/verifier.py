@@ -13,6 +13,8 @@ import time
 from datetime import datetime, timedelta
 from typing import Callable, Optional
 
+from sqlalchemy.orm import undefer
+
 from .manager import BaselineManager
 from .models import RegulationBaseline, VerificationLog, get_session
 
@@ -238,6 +240,7 @@ class RegulationVerifier:
         threshold_date = datetime.utcnow() - timedelta(days=days_threshold)
         stale_regulations = (
             session.query(RegulationBaseline)
+            .options(undefer(RegulationBaseline.search_keywords))
             .filter(RegulationBaseline.is_active == True)
             .filter(
                 (RegulationBaseline.last_verified_at == None) |
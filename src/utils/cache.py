@@ -10,6 +10,8 @@
 
 import hashlib
 import json
+import os
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -49,9 +51,6 @@ class QueryCache:
         key = self._make_key(query, jurisdiction)
         cache_file = self.cache_dir / f"{key}.json"
 
-        if not cache_file.exists():
-            return None
-
         try:
             data = json.loads(cache_file.read_text(encoding='utf-8'))
             cached_time = datetime.fromisoformat(data['timestamp'])
@@ -59,13 +58,15 @@ class QueryCache:
             # 檢查是否過期
             if datetime.now() - cached_time > self.ttl:
                 # 過期，刪除並返回 None
-                cache_file.unlink()
+                cache_file.unlink(missing_ok=True)
                 return None
 
             return data['result']
+        except FileNotFoundError:
+            return None
         except (json.JSONDecodeError, KeyError, ValueError):
             # 快取檔案損壞，刪除
-            cache_file.unlink()
+            cache_file.unlink(missing_ok=True)
             return None
 
     def set(self, query: str, jurisdiction: str, result: dict) -> str:
@@ -90,10 +91,13 @@ class QueryCache:
             'result': result
         }
 
-        cache_file.write_text(
+        # 先寫入暫存檔再取代，多執行緒同時寫入時讀取端不會讀到寫到一半的檔案
+        tmp_file = cache_file.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_file.write_text(
             json.dumps(cache_data, ensure_ascii=False, indent=2),
             encoding='utf-8'
         )
+        os.replace(tmp_file, cache_file)
 
         return key
 
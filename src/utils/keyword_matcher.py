@@ -0,0 +1,101 @@
+"""
+多關鍵字比對模組
+
+將一組關鍵字預先編譯為比對器，一次掃描即可找出文字中出現的所有關鍵字。
+
+- 已安裝 pyahocorasick 時使用 Aho-Corasick 自動機 (C 擴充)
+- 未安裝時退回預先小寫化的關鍵字清單逐一比對
+"""
+
+from collections.abc import Hashable, Iterable, Iterator
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - 依安裝環境而定
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    多關鍵字比對器
+
+    每個關鍵字綁定一個標籤 (例如法規名稱、產業代碼)，比對時回傳命中的標籤。
+    比對不分大小寫 (casefold)。
+    """
+
+    def __init__(self, keywords: Iterable[tuple[str, Hashable]]):
+        """
+        建立比對器
+
+        Args:
+            keywords: (關鍵字, 標籤) 序列；同一關鍵字可對應多個標籤
+        """
+        index: dict[str, list[Hashable]] = {}
+        for keyword, tag in keywords:
+            key = keyword.casefold() if keyword else ""
+            if not key:
+                continue
+            tags = index.setdefault(key, [])
+            if tag not in tags:
+                tags.append(tag)
+
+        self._index: dict[str, tuple[Hashable, ...]] = {k: tuple(v) for k, v in index.items()}
+        self._automaton = None
+
+        if ahocorasick is not None and self._index:
+            automaton = ahocorasick.Automaton()
+            for key, tags in self._index.items():
+                automaton.add_word(key, tags)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def iter_matches(self, text: str) -> Iterator[Hashable]:
+        """
+        依序產生文字中命中的標籤 (可能重複)
+
+        Args:
+            text: 要比對的文字
+
+        Yields:
+            命中關鍵字的標籤
+        """
+        if not text or not self._index:
+            return
+
+        haystack = text.casefold()
+
+        if self._automaton is not None:
+            for _, tags in self._automaton.iter(haystack):
+                yield from tags
+            return
+
+        for key, tags in self._index.items():
+            if key in haystack:
+                yield from tags
+
+    def match(self, text: str) -> set[Hashable]:
+        """
+        取得文字中命中的所有標籤
+
+        Args:
+            text: 要比對的文字
+
+        Returns:
+            命中的標籤集合
+        """
+        return set(self.iter_matches(text))
+
+    def contains_any(self, text: str) -> bool:
+        """
+        檢查文字是否包含任一關鍵字 (命中第一個即返回)
+
+        Args:
+            text: 要比對的文字
+
+        Returns:
+            是否命中
+        """
+        return next(self.iter_matches(text), None) is not None
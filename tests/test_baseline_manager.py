@@ -0,0 +1,201 @@
+"""
+法規 Baseline 管理器單元測試
+
+測試 src/database/manager.py 的查詢不會在回傳後觸發延遲載入（N+1 查詢）。
+"""
+
+import pytest
+from sqlalchemy import event, select
+
+from src.database import models
+from src.database.manager import BaselineManager
+from src.database.models import Country, Industry, RegulationBaseline
+
+
+@pytest.fixture
+def manager(temp_dir, monkeypatch):
+    """建立使用暫存資料庫的管理器，並寫入少量測試資料"""
+    monkeypatch.setattr(models, "get_database_path", lambda: temp_dir / "baseline.db")
+    models.init_database()
+
+    manager = BaselineManager()
+    manager.session.add_all([
+        Country(code="TW", name_zh="台灣", name_en="Taiwan", region="東亞"),
+        Country(code="JP", name_zh="日本", name_en="Japan", region="東亞"),
+        Industry(code="banking", name_zh="銀行業", name_en="Banking"),
+    ])
+    manager.session.commit()
+    manager.add_regulations_bulk([
+        {
+            "name": f"法規 {i}",
+            "country_code": "TW" if i % 2 else "JP",
+            "industry_code": "banking",
+            "topic_code": "privacy",
+            "search_keywords": [f"關鍵字 {i}", f"keyword {i}"],
+            "is_mandatory": i % 3 == 0,
+        }
+        for i in range(30)
+    ])
+
+    yield manager
+
+    manager.close()
+    engine = models.get_engine()
+    engine.dispose()
+    models._ENGINES.pop(str(engine.url), None)
+    models._SESSION_FACTORIES.pop(str(engine.url), None)
+
+
+@pytest.fixture
+def statements(manager):
+    """記錄管理器執行的 SQL 語句"""
+    executed = []
+    engine = manager.session.get_bind()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
+class TestBaselineManagerQueries:
+    """BaselineManager 查詢次數測試"""
+
+    def test_get_statistics_uses_fixed_queries(self, manager, statements):
+        """測試統計資料的查詢數不隨法規筆數增加"""
+        stats = manager.get_statistics()
+
+        assert stats["total"] == 30
+        assert stats["by_country"] == {"台灣": 15, "日本": 15}
+        assert len(statements) == 3
+
+    def test_get_statistics_without_industries(self, manager, statements):
+        """測試不需要產業統計時省去該查詢"""
+        stats = manager.get_statistics(include_industries=False)
+
+        assert stats["total"] == 30
+        assert stats["by_industry"] == {}
+        assert len(statements) == 2
+
+    def test_regulations_usable_after_session_closed(self, manager, statements):
+        """測試查詢結果在 Session 關閉後仍可讀取所有欄位，不會再觸發查詢"""
+        regulations = manager.get_regulations_by_query(country_code="TW")
+        manager.close()
+
+        assert len(regulations) == 15
+        for regulation in regulations:
+            assert regulation.search_keywords == [regulation.name.replace("法規", "關鍵字"), regulation.name.replace("法規", "keyword")]
+            assert regulation.applicable_industries is None
+            assert regulation.found_count == 0
+        assert len(statements) == 1
+
+    def test_get_search_keywords_single_query(self, manager, statements):
+        """測試搜尋關鍵字以單一查詢展開"""
+        keywords = manager.get_search_keywords(country_code="JP")
+
+        assert [row["keyword"] for row in keywords[:2]] == ["關鍵字 0", "keyword 0"]
+        assert len(keywords) == 2 * 5
+        assert len(statements) == 1
+
+    def test_reference_lookups_hit_cache(self, manager, statements):
+        """測試國家/產業名稱查詢只在建立快取時查詢資料庫"""
+        assert manager.get_country_by_name("Japan").code == "JP"
+        assert manager.get_industry_by_name("銀行").code == "banking"
+        queries = len(statements)
+
+        assert manager.get_country_by_name("tw").code == "TW"
+        assert manager.get_country_by_name("台灣").code == "TW"
+        assert manager.get_industry_by_name("BANK").code == "banking"
+        assert manager.get_industry_by_name("銀行").code == "banking"
+        assert len(statements) == queries
+
+    def test_committed_objects_not_reloaded(self, manager, statements):
+        """測試提交後讀取物件屬性不會重新查詢（expire_on_commit=False）"""
+        regulation = manager.add_regulation(
+            name="新法規", country_code="TW", industry_code="banking", topic_code="privacy",
+        )
+        regulation = manager.update_regulation(regulation.id, regulation_type="法律")
+        queries = len(statements)
+
+        assert regulation.name == "新法規"
+        assert regulation.regulation_type == "法律"
+        assert regulation.confidence_score == 0.5
+        assert len(statements) == queries
+
+    def test_export_to_dict_returns_list(self, manager):
+        """測試匯出回傳可重複使用的列表，與串流版本內容相同"""
+        exported = manager.export_to_dict(country_code="TW")
+
+        assert isinstance(exported, list)
+        assert len(exported) == 15
+        assert exported == list(manager.iter_export_dicts(country_code="TW"))
+
+
+class TestBaselineManagerBulk:
+    """BaselineManager 批次新增測試"""
+
+    def test_bulk_upsert_updates_changed_rows_only(self, manager, statements):
+        """測試 upsert 以單一語句新增新法規並只更新內容有變動的既有法規"""
+        rows = [
+            {"name": "法規 0", "country_code": "JP", "industry_code": "banking", "topic_code": "privacy",
+             "search_keywords": ["關鍵字 0", "keyword 0"]},
+            {"name": "法規 1", "country_code": "TW", "industry_code": "banking", "topic_code": "privacy",
+             "name_en": "Regulation 1", "search_keywords": ["關鍵字 1", "keyword 1"]},
+            {"name": "新法規", "country_code": "TW", "industry_code": "banking", "topic_code": "privacy"},
+        ]
+
+        assert manager.add_regulations_bulk(rows, upsert=True) == 2
+        assert not any(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+        name_en = select(RegulationBaseline.name_en).where(RegulationBaseline.name == "法規 1")
+        assert manager.session.scalar(name_en) == "Regulation 1"
+        assert manager.add_regulations_bulk(rows, upsert=True) == 0
+        assert manager.get_statistics()["total"] == 31
+
+    def test_bulk_insert_without_existing_check_skips_existing_rows(self, manager, statements):
+        """測試不預先查詢時由唯一鍵衝突略過既有法規，不改寫既有內容"""
+        rows = [
+            {"name": "法規 1", "country_code": "TW", "industry_code": "banking", "topic_code": "privacy",
+             "name_en": "Regulation 1"},
+            {"name": "新法規", "country_code": "TW", "industry_code": "banking", "topic_code": "privacy"},
+        ]
+
+        assert manager.add_regulations_bulk(rows, check_existing=False) == 1
+        assert not any(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+        name_en = select(RegulationBaseline.name_en).where(RegulationBaseline.name == "法規 1")
+        assert manager.session.scalar(name_en) is None
+        assert manager.add_regulations_bulk(rows, check_existing=False) == 0
+
+
+class TestBaselineManagerVerification:
+    """BaselineManager 驗證記錄測試"""
+
+    def test_record_verification_updates_loaded_regulation(self, manager):
+        """測試記錄驗證後，已載入的法規物件反映資料庫中的計數、時間與信心度"""
+        regulation = manager.session.scalars(
+            select(RegulationBaseline).where(RegulationBaseline.name == "法規 0")
+        ).one()
+        old_confidence = regulation.confidence_score
+
+        log = manager.record_verification(regulation.id, True)
+
+        assert log.old_confidence == old_confidence
+        assert regulation.found_count == 1
+        assert regulation.not_found_count == 0
+        assert regulation.last_found_at is not None
+        assert regulation.last_verified_at is not None
+        assert regulation.confidence_score == log.new_confidence
+        assert manager.calculate_confidence(regulation) == log.new_confidence
+
+        log = manager.record_verification(regulation.id, False)
+
+        assert log.was_found is False
+        assert regulation.found_count == 1
+        assert regulation.not_found_count == 1
+        assert manager.calculate_confidence(regulation) == log.new_confidence
+
+    def test_record_verification_unknown_regulation(self, manager):
+        """測試記錄不存在的法規時拋出 ValueError"""
+        with pytest.raises(ValueError):
+            manager.record_verification(99999, True)
@@ -186,3 +186,20 @@ class TestQueryCache:
 
         assert tw_result["region"] == "台灣"
         assert jp_result["region"] == "日本"
+
+    def test_concurrent_set_leaves_complete_file(self, temp_dir):
+        """測試多執行緒同時寫入同一快取時，讀取到的都是完整檔案且不留下暫存檔"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = QueryCache(cache_dir=str(temp_dir), ttl_hours=1)
+        payload = {"data": "x" * 100_000}
+
+        def write_and_read(_):
+            cache.set("並行查詢", "TW", payload)
+            return cache.get("並行查詢", "TW")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(write_and_read, range(32)))
+
+        assert all(result == payload for result in results)
+        assert not list(Path(temp_dir).glob("*.tmp"))
@@ -0,0 +1,58 @@
+"""
+關鍵字比對模組單元測試
+
+測試 src/utils/keyword_matcher.py 的功能。
+"""
+
+import pytest
+
+from src.utils import keyword_matcher
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+@pytest.fixture(params=["automaton", "fallback"])
+def matcher_factory(request, monkeypatch):
+    """分別以 Aho-Corasick 與後備比對路徑建立比對器"""
+    if request.param == "automaton" and keyword_matcher.ahocorasick is None:
+        pytest.skip("pyahocorasick 未安裝")
+    if request.param == "fallback":
+        monkeypatch.setattr(keyword_matcher, "ahocorasick", None)
+    return KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """KeywordMatcher 類別測試"""
+
+    def test_match_returns_tags(self, matcher_factory):
+        """測試命中關鍵字時回傳對應標籤"""
+        matcher = matcher_factory([("GDPR", "gdpr"), ("個資", "pdpa"), ("資安", "cyber")])
+
+        assert matcher.match("歐盟 gdpr 與個資規範") == {"gdpr", "pdpa"}
+
+    def test_match_is_case_insensitive(self, matcher_factory):
+        """測試比對不分大小寫"""
+        matcher = matcher_factory([("IoT", "iot")])
+
+        assert matcher.match("iot 產品安全") == {"iot"}
+        assert matcher.match("IOT") == {"iot"}
+
+    def test_shared_keyword_maps_to_multiple_tags(self, matcher_factory):
+        """測試同一關鍵字可對應多個標籤"""
+        matcher = matcher_factory([("資安", "A"), ("資安", "B"), ("資安", "A")])
+
+        assert matcher.match("資安法規") == {"A", "B"}
+        assert len(matcher) == 1
+
+    def test_empty_keywords_are_ignored(self, matcher_factory):
+        """測試空字串關鍵字不會命中所有文字"""
+        matcher = matcher_factory([("", "empty"), ("NIS", "nis")])
+
+        assert matcher.match("任意文字") == set()
+        assert not matcher.contains_any("")
+
+    def test_contains_any(self, matcher_factory):
+        """測試任一關鍵字命中判斷"""
+        matcher = matcher_factory([("醫療", "healthcare")])
+
+        assert matcher.contains_any("醫療機構資安指引")
+        assert not matcher.contains_any("金融機構資安指引")
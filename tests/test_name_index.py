@@ -0,0 +1,81 @@
+"""
+法規名稱索引單元測試
+
+測試 src/database/name_index.py 的完全相符、前綴與相似度查詢。
+"""
+
+import pytest
+
+from src.database.name_index import RegulationNameIndex, jaccard, name_tokens, normalize_name
+
+
+@pytest.fixture
+def index():
+    """建立包含中英文法規名稱的索引"""
+    return RegulationNameIndex([
+        "Personal Data Protection Act",
+        "  資通安全管理法  ",
+        "Technology Risk Management Guidelines",
+    ])
+
+
+class TestNormalize:
+    """名稱正規化與分詞測試"""
+
+    def test_normalize_name(self):
+        """測試正規化為小寫並去除前後空白，None 視為空字串"""
+        assert normalize_name("  GDPR Act ") == "gdpr act"
+        assert normalize_name(None) == ""
+
+    def test_name_tokens(self):
+        """測試以空白分詞，無空白的名稱視為單一詞"""
+        assert name_tokens("banking act") == frozenset({"banking", "act"})
+        assert name_tokens("個資法") == frozenset({"個資法"})
+
+    def test_jaccard(self):
+        """測試 Jaccard 相似度"""
+        assert jaccard(frozenset("ab"), frozenset("bc")) == pytest.approx(1 / 3)
+        assert jaccard(frozenset(), frozenset()) == 0.0
+
+
+class TestRegulationNameIndex:
+    """RegulationNameIndex 查詢測試"""
+
+    def test_contains_exact_match(self, index):
+        """測試完全相符查詢使用正規化後的名稱"""
+        assert index.contains("personal data protection act")
+        assert index.contains("資通安全管理法")
+        assert not index.contains("personal data protection")
+        assert not index.contains("personal data protection act 2012")
+
+    def test_longest_prefix(self, index):
+        """測試找出屬於查詢名稱前綴的最長既有名稱"""
+        assert index.longest_prefix("資通安全管理法施行細則") == len("資通安全管理法")
+        assert index.longest_prefix("資通安全") == 0
+        assert index.longest_prefix("unknown act") == 0
+
+    def test_find_similar(self, index):
+        """測試相似度超過門檻時回傳既有名稱，沒有共同詞時不回傳"""
+        assert index.find_similar("personal data protection act 2012", 0.7) == "personal data protection act"
+        assert index.find_similar("technology risk management guidelines", 0.5) == (
+            "technology risk management guidelines"
+        )
+        assert index.find_similar("資通安全管理法規", 0.8) is None
+        assert index.find_similar("cybersecurity act", 0.8) is None
+        assert index.find_similar("", 0.0) is None
+
+    def test_find_similar_threshold_is_exclusive(self, index):
+        """測試相似度剛好等於門檻時不算相似"""
+        # 4 個共同詞 / 聯集 5 個詞 = 0.8
+        name = "personal data protection act 2012"
+        assert index.find_similar(name, 0.8) is None
+        assert index.find_similar(name, 0.79) == "personal data protection act"
+
+    def test_empty_and_duplicate_names_ignored(self):
+        """測試空值、None 與重複名稱不會加入索引"""
+        index = RegulationNameIndex([None, "", "   ", "GDPR", " gdpr "])
+
+        assert len(index) == 1
+        assert list(index) == ["gdpr"]
+        assert not index.contains("")
+        assert index.longest_prefix("") == 0
@@ -0,0 +1,93 @@
+"""
+法規產業適用性更新單元測試
+
+測試 src/database/update_industry_applicability.py 依名稱關鍵字標記法規，且重複執行不改寫資料。
+"""
+
+import pytest
+from sqlalchemy import event, select
+
+from src.database import models
+from src.database.manager import BaselineManager
+from src.database.models import RegulationBaseline
+from src.database.update_industry_applicability import (
+    ALL_INDUSTRIES,
+    FINANCE_SUB_INDUSTRIES,
+    update_industry_applicability,
+)
+
+
+@pytest.fixture
+def engine(temp_dir, monkeypatch):
+    """建立使用暫存資料庫的引擎，並寫入跨產業、金融業與未命中關鍵字的法規"""
+    monkeypatch.setattr(models, "get_database_path", lambda: temp_dir / "baseline.db")
+    models.init_database()
+
+    manager = BaselineManager()
+    manager.add_regulations_bulk([
+        {"name": name, "name_en": name_en, "country_code": country_code,
+         "industry_code": "finance_general", "topic_code": "cybersecurity"}
+        for name, name_en, country_code in (
+            ("個人資料保護法", None, "TW"),
+            ("Personal Data Protection Act 2012", None, "SG"),
+            ("電子金融取引法", "Electronic Financial Transactions Act", "KR"),
+            ("Technology Risk Management Guidelines", "MAS TRM", "SG"),
+            ("資通安全管理法", None, "TW"),
+            ("Outsourcing Guidelines", None, "SG"),
+        )
+    ])
+    manager.close()
+
+    engine = models.get_engine()
+    yield engine
+
+    engine.dispose()
+    models._ENGINES.pop(str(engine.url), None)
+    models._SESSION_FACTORIES.pop(str(engine.url), None)
+
+
+def _applicability(engine) -> dict[str, tuple[bool, list[str]]]:
+    """讀取各法規的 (是否跨產業, 適用產業)"""
+    table = RegulationBaseline.__table__
+    with engine.connect() as connection:
+        rows = connection.execute(
+            select(table.c.name, table.c.is_cross_industry, table.c.applicable_industries)
+        ).all()
+    return {name: (is_cross, industries) for name, is_cross, industries in rows}
+
+
+class TestUpdateIndustryApplicability:
+    """update_industry_applicability 測試"""
+
+    def test_marks_regulations_by_keywords(self, engine):
+        """測試跨產業法規適用所有產業，其餘（含未命中關鍵字者）適用金融子產業"""
+        update_industry_applicability()
+
+        assert _applicability(engine) == {
+            "個人資料保護法": (True, ALL_INDUSTRIES),
+            "Personal Data Protection Act 2012": (True, ALL_INDUSTRIES),
+            "資通安全管理法": (True, ALL_INDUSTRIES),
+            "電子金融取引法": (False, FINANCE_SUB_INDUSTRIES),
+            "Technology Risk Management Guidelines": (False, FINANCE_SUB_INDUSTRIES),
+            "Outsourcing Guidelines": (False, FINANCE_SUB_INDUSTRIES),
+        }
+
+    def test_second_run_changes_no_rows(self, engine):
+        """測試重複執行時內容未變動的法規不會被改寫"""
+        update_industry_applicability()
+        first = _applicability(engine)
+
+        updated_rows = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("UPDATE"):
+                updated_rows.append(cursor.rowcount)
+
+        event.listen(engine, "after_cursor_execute", record)
+        try:
+            update_industry_applicability()
+        finally:
+            event.remove(engine, "after_cursor_execute", record)
+
+        assert updated_rows and sum(updated_rows) == 0
+        assert _applicability(engine) == first